@@ -0,0 +1,198 @@
+import argparse
+import contextlib
+import gzip
+import hashlib
+import json
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import Response
+from starlette.routing import Route
+
+import content_store
+import render
+
+# -------------------------------
+# JSON API for embedding Wayback content on other sites
+#
+#   GET /niches
+#   GET /niches/{niche}/years
+#   GET /niches/{niche}/years/{year}
+#
+# {niche} is the specialism name (URL-encoded) or its slug ("cloud-infrastructure").
+# Payloads come from the same process-wide content store as app.py, so they are
+# the cleaned paragraphs ("$" is escaped as the HTML entity "&#36;"). Each response
+# body, its gzip copy and ETag are built once per niche content version and reused;
+# If-None-Match answers 304 without a body.
+# Runs on Starlette + uvicorn, which ship with Streamlit.
+# -------------------------------
+DATA_PATH = content_store.DATA_PATH
+
+CACHE_CONTROL = "public, max-age=300"
+GZIP_MIN_BYTES = 512
+
+RESPONSES = render.RenderCache()
+content_store.on_reload(lambda previous, store, changed: RESPONSES.discard_niches(changed))
+
+
+class Encoded:
+    # Both representations of one response, each with its own strong ETag
+    __slots__ = ("body", "gzipped", "etag", "gzip_etag")
+
+    def __init__(self, payload: dict) -> None:
+        self.body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self.gzipped = gzip.compress(self.body, compresslevel=6, mtime=0) if len(self.body) >= GZIP_MIN_BYTES else None
+        digest = hashlib.sha256(self.body).hexdigest()[:32]
+        self.etag = f'"{digest}"'
+        self.gzip_etag = f'"{digest}-gzip"' if self.gzipped is not None else None
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    # If-None-Match may list several tags, weak ones (W/"...") or "*"
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in tags or etag in tags
+
+
+def accepts_gzip(header: str) -> bool:
+    # Accept-Encoding with q-values: "gzip;q=0" refuses gzip, "*" stands in for
+    # codings not listed
+    qualities = {}
+    for item in header.split(","):
+        coding, *params = [part.strip() for part in item.split(";")]
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qualities[coding.lower()] = q
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return False
+
+
+def respond(request, encoded: Encoded) -> Response:
+    # Pick the representation first: its ETag is the one If-None-Match is checked against
+    gzipped = encoded.gzipped is not None and accepts_gzip(request.headers.get("accept-encoding", ""))
+    etag = encoded.gzip_etag if gzipped else encoded.etag
+    headers = {
+        "ETag": etag,
+        "Cache-Control": CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+        "Access-Control-Allow-Origin": "*",
+    }
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+
+    if gzipped:
+        headers["Content-Encoding"] = "gzip"
+        return Response(encoded.gzipped, media_type="application/json", headers=headers)
+    return Response(encoded.body, media_type="application/json", headers=headers)
+
+
+def not_found(message: str) -> Response:
+    body = json.dumps({"error": message}).encode("utf-8")
+    return Response(body, status_code=404, media_type="application/json", headers={"Access-Control-Allow-Origin": "*"})
+
+
+def resolve_niche(store, name: str):
+    if name in store.niches:
+        return name
+    return next((niche for niche in store.niches if content_store.niche_slug(niche) == name), None)
+
+
+async def current_store():
+    # A stat on the event loop; an edit's reload (read, parse, clean) runs in the
+    # threadpool so it doesn't stall every open connection
+    store = content_store.loaded_store(DATA_PATH)
+    if store is None:
+        store = await run_in_threadpool(content_store.get_store, DATA_PATH)
+    return store
+
+
+# -------------------------------
+# Routes
+# -------------------------------
+async def list_niches(request) -> Response:
+    store = await current_store()
+
+    def build():
+        return Encoded({
+            "version": store.version,
+            "niches": [
+                {"name": niche, "slug": content_store.niche_slug(niche), "years": store.available_years_for(niche)}
+                for niche in store.niches
+            ],
+        })
+
+    return respond(request, RESPONSES.get((store.version, "api", None, "niches"), build))
+
+
+async def list_years(request) -> Response:
+    store = await current_store()
+    niche = resolve_niche(store, request.path_params["niche"])
+    if niche is None:
+        return not_found("unknown specialism")
+
+    def build():
+        return Encoded({"niche": niche, "years": store.available_years_for(niche)})
+
+    return respond(request, RESPONSES.get((store.niche_version(niche), "api", niche, "years"), build))
+
+
+async def year_payload(request) -> Response:
+    store = await current_store()
+    niche = resolve_niche(store, request.path_params["niche"])
+    year = request.path_params["year"]
+    if niche is None:
+        return not_found("unknown specialism")
+    if year not in store.available_years_for(niche):
+        return not_found("unknown year")
+
+    def build():
+        payload = store.get_year_payload(niche, year)
+        return Encoded({
+            "niche": niche,
+            "year": year,
+            "sections": [
+                {"key": key, "title": title, "paragraphs": payload[key]}
+                for key, title in render.SECTION_ORDER
+            ],
+            "conclusion": payload["conclusion"],
+        })
+
+    return respond(request, RESPONSES.get((store.niche_version(niche), "api", niche, year), build))
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app):
+    # Load (and clean, if there are no build artifacts) before the first request
+    content_store.get_store(DATA_PATH)
+    yield
+
+
+app = Starlette(
+    routes=[
+        Route("/niches", list_niches),
+        Route("/niches/{niche}/years", list_years),
+        Route("/niches/{niche}/years/{year}", year_payload),
+    ],
+    lifespan=lifespan,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve cleaned Wayback content as JSON.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    args = parser.parse_args()
+
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning", access_log=False)
+
+
+if __name__ == "__main__":
+    main()
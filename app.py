@@ -1,150 +1,39 @@
-import base64
-import json
-import re
-import unicodedata
+import os
 from pathlib import Path
 import streamlit as st
-import streamlit.components.v1 as components
 
-def render_interactive_tools_hub(current_tool: str) -> None:
-    tools = [
-    {
-        "name": "Candidate Market Insight",
-        "url": "https://www.hamilton-barnes.com/candidate-market-insight",
-        "summary": "Explore broader candidate-side market trends, hiring movement, and skill demand across selected technology areas to better understand where the market is shifting."
-    },
-    {
-        "name": "UK Salary Calculator",
-        "url": "https://hamilton-barnes-salary-calculator-uk.streamlit.app/",
-        "summary": "Benchmark salary expectations across the UK market using role, level, and location inputs designed to help candidates and hiring teams sense-check compensation more clearly."
-    },
-    {
-        "name": "Germany Salary Calculator",
-        "url": "https://hamilton-barnes-germany-salary-calculator.streamlit.app/",
-        "summary": "Benchmark salary expectations across the German market using role, level, and location inputs to give users a more practical view of market positioning."
-    },
-    {
-        "name": "Wayback Machine",
-        "url": "https://hamilton-barnes-wayback-machine.streamlit.app/",
-        "summary": "Explore how each specialism has evolved over time across market shifts, technical development, talent demand, and investment context through a structured year-by-year view."
-    },
-]
-
-    visible_tools = [tool for tool in tools if tool["name"] != current_tool]
-
-    cards_html = ""
-    for tool in visible_tools:
-        cards_html += f"""
-        <div class="hb-tool-card">
-            <div class="hb-tool-card-title">{tool["name"]}</div>
-            <div class="hb-tool-card-line">{tool["summary"]}</div>
-            <a class="hb-tool-card-link" href="{tool["url"]}" target="_blank">Open tool</a>
-        </div>
-        """
-
-    full_html = f"""
-    <html>
-    <head>
-    <style>
-        body {{
-            margin: 0;
-            font-family: Arial, sans-serif;
-            color: #000000;
-            background: transparent;
-        }}
-
-        .tools-hub-wrap {{
-            margin-top: 0.5rem;
-        }}
-
-        .tools-hub-title {{
-            text-align: center;
-            font-size: 1.7rem;
-            font-weight: 700;
-            margin-bottom: 0.5rem;
-        }}
-
-        .tools-hub-subtitle {{
-            text-align: center;
-            font-size: 0.95rem;
-            max-width: 760px;
-            margin: 0 auto 1.6rem auto;
-            line-height: 1.6;
-        }}
-
-        .tools-grid {{
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 18px;
-        }}
-
-        .hb-tool-card {{
-            background: rgba(255, 255, 255, 0.58);
-            border: 1px solid rgba(0, 0, 0, 0.08);
-            border-radius: 22px;
-            padding: 1.15rem 1.2rem 1rem 1.2rem;
-            backdrop-filter: blur(10px);
-            -webkit-backdrop-filter: blur(10px);
-            box-shadow: 0 10px 26px rgba(0, 0, 0, 0.05);
-        }}
-
-        .hb-tool-card-title {{
-            font-size: 1.15rem;
-            font-weight: 700;
-            margin-bottom: 0.6rem;
-        }}
-
-        .hb-tool-card-line {{
-            font-size: 0.9rem;
-            line-height: 1.5;
-            margin-bottom: 0.35rem;
-        }}
-
-        .hb-tool-card-link {{
-            display: inline-block;
-            margin-top: 0.6rem;
-            padding: 0.25rem 0.8rem;
-            border-radius: 999px;
-            border: 1px solid #b5c1cf;
-            background: transparent;
-            color: black;
-            text-decoration: none;
-            font-size: 0.82rem;
-            font-weight: 500;
-        }}
-
-        .hb-tool-card-link:hover {{
-            border-color: #7ac043;
-            color: #7ac043;
-        }}
-
-        @media (max-width: 768px) {{
-            .tools-grid {{
-                grid-template-columns: 1fr;
-            }}
-        }}
-    </style>
-    </head>
-    <body>
-        <div class="tools-hub-wrap">
-            <div class="tools-hub-title">Explore More Interactive Tools</div>
-            <div class="tools-hub-subtitle">
-                Explore the rest of the Hamilton Barnes interactive toolset below. Each one is designed to help users better understand salary benchmarks, market positioning, or long-term specialism shifts, while making it easier to move between related tools.
-            </div>
-
-            <div class="tools-grid">
-                {cards_html}
-            </div>
-        </div>
-    </body>
-    </html>
-    """
+import background
+import content_store
+import page_setup
+import render
+import search_index
+import timing
 
-    components.html(full_html, height=1100, scrolling=False)
+def embed_html(html: str, height="content") -> None:
+    # Every self-contained HTML document the app embeds goes through one iframe
+    # helper (st.iframe replaces the deprecated components.html)
+    st.iframe(html, height=height)
+
+def render_interactive_tools_hub(current_tool: str) -> None:
+    embed_html(render.tools_hub_html(current_tool))
 
 # Page config
 st.set_page_config(page_title="Specialism Wayback Machine", layout="centered")
 
+# -------------------------------
+# Timing (opt-in): WAYBACK_TIMING=1 logs JSON spans, ?debug adds a per-session panel
+# -------------------------------
+DEBUG = "debug" in st.query_params
+TIMING_LOG = timing.logging_enabled()
+
+
+def new_timer(scope: str) -> timing.Timer:
+    stats = st.session_state.setdefault("_timing_stats", timing.SessionStats()) if DEBUG else None
+    return timing.Timer(scope, log=TIMING_LOG, stats=stats)
+
+
+timer = new_timer("app")
+
 # Styling
 st.markdown(
     """
@@ -172,28 +61,7 @@ h2, h3 {
     margin-top: 1.4rem !important;
 }
 
-/* Glass card box */
-.glass-card {
-    background: rgba(255, 255, 255, 0.55);
-    border: 1px solid rgba(0, 0, 0, 0.08);
-    border-radius: 18px;
-    padding: 1.3rem 1.5rem;
-    margin-top: 0.6rem;
-    margin-bottom: 1.6rem;
-    backdrop-filter: blur(10px);
-    -webkit-backdrop-filter: blur(10px);
-    box-shadow: 0 10px 30px rgba(0,0,0,0.06);
-}
-
-.glass-card p {
-    margin: 0 0 0.9rem 0;
-    line-height: 1.6;
-}
-
-.glass-card p:last-child {
-    margin-bottom: 0;
-}
-</style>
+""" + render.GLASS_CARD_CSS + """</style>
 """,
     unsafe_allow_html=True,
 )
@@ -202,145 +70,39 @@ h2, h3 {
 # Background
 # -------------------------------
 def set_background(image_path: Path) -> None:
-    encoded = base64.b64encode(image_path.read_bytes()).decode()
-    css = f"""
-    <style>
-    [data-testid="stAppViewContainer"] {{
-        background-image: url("data:image/jpg;base64,{encoded}") !important;
-        background-size: cover !important;
-        background-position: center !important;
-        background-attachment: fixed !important;
-    }}
-    </style>
-    """
+    # Static serving lets browsers cache the image (and pick a smaller variant on
+    # narrow screens); otherwise fall back to the inline base64 CSS, encoded once per process.
+    css = background.background_css(image_path, static_serving=st.get_option("server.enableStaticServing"))
     st.markdown(css, unsafe_allow_html=True)
 
 
 BASE_DIR = Path(__file__).parent
 bg_path = BASE_DIR / "assets" / "bg1.jpg"
 if bg_path.exists():
-    set_background(bg_path)
+    with timer.span("background"):
+        set_background(bg_path)
 
 # -------------------------------
-# Load content.json
+# Load content.json (parsed + cleaned once per process, see content_store.py)
 # -------------------------------
 DATA_PATH = BASE_DIR / "data" / "content.json"
-if not DATA_PATH.exists():
-    st.error("Missing data/content.json")
-    st.stop()
-
-try:
-    content = json.loads(DATA_PATH.read_text(encoding="utf-8"))
-except Exception as e:
-    st.error("content.json is not valid JSON")
-    st.code(str(e))
-    st.stop()
-
-# -------------------------------
-# Runtime cleaner (fix glued text + $ issues)
-# -------------------------------
-ZERO_WIDTH = dict.fromkeys(map(ord, ["\u200B", "\u200C", "\u200D", "\uFEFF"]), None)
-
-def clean_text(s: str) -> str:
-    if not isinstance(s, str):
-        return s
-
-    s = unicodedata.normalize("NFKC", s)
-    s = s.translate(ZERO_WIDTH)
-
-    # Remove em/en dashes
-    s = s.replace("—", "-").replace("–", "-")
-
-    # Escape $ so Streamlit doesn't trigger math mode
-    s = s.replace("$", "&#36;")
-
-    # Fix missing space after full stop
-    s = re.sub(r"\.([A-Za-z0-9])", r". \1", s)
-
-    # Fix glued digit-letter boundaries
-    s = re.sub(r"(\d)([A-Za-z])", r"\1 \2", s)
-    s = re.sub(r"([A-Za-z])(\d)", r"\1 \2", s)
-
-    # Fix quarters: "Q 1" -> "Q1" (case-insensitive)
-    s = re.sub(r"\bQ\s+([1-4])\b", r"Q\1", s, flags=re.IGNORECASE)
-    s = re.sub(r"\bFY\s+(\d{2,4})\b", r"FY\1", s, flags=re.IGNORECASE)  # optional
-    
-    # Fix in2026
-    s = re.sub(r"\bin(?=\d{4}\b)", "in ", s)
-
-    # -----------------------------
-    # FIX ALL DECIMAL SPACING
-    # "653. 4" → "653.4"
-    # "6. 15" → "6.15"
-    # -----------------------------
-    s = re.sub(r"(\d+)\.\s+(\d+)", r"\1.\2", s)
-
-    # -----------------------------
-    # FIX NUMBER + UNIT SPACING
-    # "3.7 T" → "3.7T"
-    # "653.4 B" → "653.4B"
-    # "12.5 %" → "12.5%"
-    # -----------------------------
-    s = re.sub(r"(\d+(?:\.\d+)?)\s*(T|B|M|K|%)\b", r"\1\2", s)
-
-    # -----------------------------
-    # FIX CURRENCY SPACING
-    # "$ 3.7T" → "$3.7T"
-    # -----------------------------
-    s = re.sub(r"\$\s*(\d)", r"$\1", s)
-
-    # -----------------------------
-    # FIX AI casing globally
-    # -----------------------------
-    s = re.sub(r"\bai\b", "AI", s, flags=re.IGNORECASE)
-
-    # Collapse multiple spaces
-    s = re.sub(r"[ ]{2,}", " ", s)
-
-    # Re-join common tech tokens that should NOT be split
-    # 3G/4G/5G/6G, 5GHz, Q1-Q4, DDoS, SASE, SD-WAN, etc.
-
-    # Join digit + G patterns: "5 G" -> "5G"
-    s = re.sub(r"\b([3-6])\s+G\b", r"\1G", s)
-
-    # Join GHz patterns: "5 GHz" -> "5GHz"
-    s = re.sub(r"\b(\d+)\s+GHz\b", r"\1GHz", s, flags=re.IGNORECASE)
-
-    # Join quarter tokens: "Q 1" -> "Q1"
-    s = re.sub(r"\bQ\s*([1-4])\b", r"Q\1", s, flags=re.IGNORECASE)
-
-    # Fix DDoS: "DDo S" -> "DDoS"
-    s = re.sub(r"\bDDo\s+S\b", "DDoS", s)
-
-    # Fix common split acronyms like "S D-W A N" edge cases (light touch)
-    s = re.sub(r"\bSD\s*-\s*WAN\b", "SD-WAN", s, flags=re.IGNORECASE)
-    s = re.sub(r"\bSASE\b", "SASE", s)  # no-op but keeps intent clear 
-    
-    return s.strip()
-
-def walk(obj):
-    if isinstance(obj, dict):
-        return {k: walk(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [walk(v) for v in obj]
-    if isinstance(obj, str):
-        return clean_text(obj)
-    return obj
-
-content = walk(content)
+with timer.span("load"):
+    store = page_setup.load_store(DATA_PATH)
 
-# -------------------------------
-# Helper
-# -------------------------------
-niches = sorted(content.keys())
-if not niches:
-    st.warning("No specialisms found in content.json")
-    st.stop()
+# Opt-in: poll content.json so an edit is reloaded (and only the edited specialisms'
+# cleaned content, rendered HTML and search/trend entries rebuilt) without a restart.
+if os.environ.get("WAYBACK_WATCH") == "1":
+    content_store.start_watcher(DATA_PATH)
 
-def available_years_for(niche: str):
-    years_dict = content.get(niche, {}).get("years", {}) or {}
-    years = sorted(years_dict.keys(), key=lambda x: int(x) if x.isdigit() else 9999)
-    return years
+# Opt-in: render every (niche, year), up to the render cache size, so no session
+# pays for a cold render (loading every shard of a sharded store). Otherwise only the
+# most visited pages are rendered, and of a sharded store only shards already loaded.
+# Both run in the background once per content version, so shared links paint from
+# the cache.
+if os.environ.get("WAYBACK_PREWARM") == "1":
+    render.prewarm_in_background(store)
+else:
+    render.warm_popular_in_background(store)
 
 # -------------------------------
 # HERO
@@ -353,110 +115,139 @@ st.write(
 st.divider()
 
 # -------------------------------
-# Controls (Dropdown + Slider)
-# -------------------------------
-niche = st.selectbox("Choose a Specialism", niches)
+# Controls (Dropdown + Slider) + Sections
+# -------------------------------
+# ?slider=client ships every year of the selected niche in one component and moves
+# the slider in the browser, so only changing the specialism reruns the script.
+CLIENT_SIDE_SLIDER = st.query_params.get("slider") == "client"
 
-years = available_years_for(niche)
-numeric_years = sorted([int(y) for y in years if y.isdigit()])
+# A fragment: selectbox/slider changes only re-run this function, so the CSS,
+# background, hero, buttons and tools hub above/below are sent once per session.
+@st.fragment
+def render_explorer() -> None:
+    store = content_store.get_store(DATA_PATH)
+    # A full run is still inside the script's timer; a fragment-only rerun gets its own
+    fragment_timer = new_timer("explorer") if timer.finished else timer
 
-if not numeric_years:
-    numeric_years = list(range(2016, 2027))
+    with fragment_timer.span("controls"):
+        # Both controls are bound to ?niche=...&year=..., so a shared link renders
+        # its selection in the first run and the URL follows the user's choices
+        niche = st.selectbox("Choose a Specialism", store.niches, key="niche", bind="query-params")
 
-year = st.slider(
-    "Range Slider",
-    min_value=min(numeric_years),
-    max_value=max(numeric_years),
-    value=min(numeric_years),
-    step=1
-)
+        years = store.available_years_for(niche)
+        numeric_years = sorted([int(y) for y in years if y.isdigit()])
 
-year = str(year)
+        if not numeric_years:
+            numeric_years = list(range(2016, 2027))
 
-st.markdown(f"## {niche}: {year}")
+        if not CLIENT_SIDE_SLIDER:
+            year = st.slider(
+                "Range Slider",
+                min_value=min(numeric_years),
+                max_value=max(numeric_years),
+                value=min(numeric_years),
+                step=1,
+                key="year",
+                bind="query-params",
+            )
 
-# -------------------------------
-# Sections (Title + Glass Card)
-# -------------------------------
-SECTION_ORDER = [
-    ("market_shift", "Market Shifts"),
-    ("technical_shift", "Technical Shifts"),
-    ("talent_shift", "Talent Shifts"),
-    ("investment", "Investment Contexts 💵"),
-]
+    # Content is cleaned the first time a specialism is read (a no-op afterwards)
+    with fragment_timer.span("clean"):
+        store.get_specialism(niche)
+
+    if CLIENT_SIDE_SLIDER:
+        with fragment_timer.span("sections"):
+            timeline, height = render.rendered_timeline(store, niche, [str(y) for y in numeric_years])
+            embed_html(timeline, height=height)
+    else:
+        year = str(year)
+        render.record_visit(niche, year)
 
-year_payload = (content.get(niche, {}).get("years", {}) or {}).get(year, {}) or {}
+        st.markdown(f"## {niche}: {year}")
 
-for key, title in SECTION_ORDER:
-    blocks = year_payload.get(key, []) or []
-    if not blocks:
-        continue
+        # -------------------------------
+        # Sections (Title + Glass Card), rendered once per (niche, year) per process
+        # -------------------------------
+        with fragment_timer.span("sections"):
+            sections, conclusion = render.rendered_year(store, niche, year)
 
-    # Title
-    st.markdown(f"### {title}")
+            for title, card in sections:
+                st.markdown(title)
+                st.markdown(card, unsafe_allow_html=True)
 
-    # Glass Box
-    box_html = '<div class="glass-card">'
-    for p in blocks:
-        box_html += f"<p>{p}</p>"
-    box_html += "</div>"
+        # -------------------------------
+        # Conclusion
+        # -------------------------------
+        with fragment_timer.span("conclusion"):
+            st. divider()
+            if conclusion:
+                st.markdown(conclusion, unsafe_allow_html=True)
 
-    st.markdown(box_html, unsafe_allow_html=True)
+    if fragment_timer is not timer:
+        fragment_timer.finish()
+
+render_explorer()
 
 # -------------------------------
-# Conclusion
+# Search (inverted index built once per content version, see search_index.py)
 # -------------------------------
-conclusion = year_payload.get("conclusion", []) or []
-st. divider()
-if conclusion:
-    box_html = """
-    <div class="glass-card">
-        <div style="font-size: 1.4rem; font-weight: 600; margin-bottom: 0.8rem;">
-            What this means 🧠
-        </div>
-    """
+SECTION_TITLES = {**dict(render.SECTION_ORDER), "conclusion": "What this means"}
 
-    for p in conclusion:
-        box_html += f"<p>{p}</p>"
 
-    box_html += "</div>"
+def year_range(years: tuple) -> str:
+    # ("2016", "2017", ..., "2026") -> "2016–2026"
+    if len(years) > 2 and all(y.isdigit() for y in years):
+        if int(years[-1]) - int(years[0]) == len(years) - 1:
+            return f"{years[0]}–{years[-1]}"
+    return ", ".join(years)
 
-    st.markdown(box_html, unsafe_allow_html=True)
+
+@st.fragment
+def render_search() -> None:
+    with st.expander("🔎 Search every specialism and year"):
+        query = st.text_input("Search", placeholder="e.g. SD-WAN, DDoS, GDPR", label_visibility="collapsed")
+        if not query.strip():
+            return
+
+        with new_timer("search").span("search"):
+            hits = search_index.get_index(content_store.get_store(DATA_PATH)).search(query)
+        if not hits:
+            st.info("No matches.")
+            return
+
+        for hit in hits:
+            st.markdown(f"**{hit.niche} · {year_range(hit.years)} · {SECTION_TITLES.get(hit.section, hit.section)}**")
+            st.markdown(search_index.snippet(hit.text, query))
+
+render_search()
+
+# The sidebar (and with it the page navigation) is hidden, so the other pages are linked here
+trends_link, compare_link = st.columns(2)
+trends_link.page_link("pages/2.Trends.py", label="Theme trends across the years", icon="📈")
+compare_link.page_link("pages/3.Compare.py", label="Compare two years side by side", icon="🆚")
 
 st.divider()
 
-buttons = [
-    ("Home", "https://www.hamilton-barnes.com/"),
-    ("Explore Roles", "https://www.hamilton-barnes.com/jobs"),
-    ("Candidates", "https://www.hamilton-barnes.com/candidates"),
-    ("Clients", "https://www.hamilton-barnes.com/clients"),
-    ("Graduates", "https://www.empowering-future-network-engineers.com/")
-]
-st.markdown(
-    "<h3 style='text-align: center;'>Explore Hamilton Barnes 🌳</h3>",
-    unsafe_allow_html=True
-)
+footer = timer.start("footer")
+st.markdown(render.FOOTER_HEADING, unsafe_allow_html=True)
+
+for label, url in render.FOOTER_LINKS:
+    st.markdown(render.footer_button_html(label, url), unsafe_allow_html=True)
+footer.stop()
+
+with timer.span("tools_hub"):
+    render_interactive_tools_hub(current_tool="Wayback Machine")
+
+timer.finish()
+
+# -------------------------------
+# Debug panel (?debug): per-stage percentiles for this session, refreshed while open
+# -------------------------------
+if DEBUG:
+    @st.fragment(run_every=2)
+    def render_debug_panel() -> None:
+        with st.expander("⏱️ Timings (this session)"):
+            rows = st.session_state["_timing_stats"].summary()
+            st.dataframe(rows, hide_index=True)
 
-for label, url in buttons:
-    st.markdown(
-        f"""
-        <a href="{url}" target="_blank">
-            <button style="
-                width: 100%;
-                padding: 0.25rem;
-                margin-bottom: 0.5rem;
-                border-radius: 5px;
-                border: 1px solid #b5c1cf;
-                background-color: transparent;
-                color: black;
-                cursor: pointer;
-                font-weight: 430;
-            ">
-                {label}
-            </button>
-        </a>
-        """,
-        unsafe_allow_html=True,
-    )
-
-render_interactive_tools_hub(current_tool="Wayback Machine")
\ No newline at end of file
+    render_debug_panel()
@@ -1,8 +1,12 @@
+import argparse
+import difflib
 import json
-from copy import deepcopy
+import os
 from pathlib import Path
 
-JSON_PATH = Path("data/content.json")
+# Next to this script, not the CWD
+JSON_PATH = Path(__file__).parent / "data" / "content.json"
+CHUNK_SIZE = 1 << 16
 
 MASTER_CONCLUSIONS = {
     "Network Automation": [
@@ -77,43 +81,190 @@ MASTER_CONCLUSIONS = {
     ],
 }
 
+# -------------------------------
+# Streaming JSON object reader
+#
+# content.json is one top-level object keyed by specialism. It is read one
+# specialism at a time, keeping the raw text of each value, so unchanged
+# specialisms are copied through byte for byte and only one is parsed at a time.
+# -------------------------------
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+class _Reader:
+    def __init__(self, f) -> None:
+        self.f = f
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                raise ValueError("unexpected end of JSON")
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"expected {char!r} at {self.buffer[self.pos:self.pos + 20]!r}")
+        self.pos += 1
+
+    def value(self):
+        # -> (parsed value, its raw JSON text)
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number at the very end of the buffer may continue in the next chunk
+            if end == len(self.buffer) and not self.eof and self.fill():
+                continue
+            raw = self.buffer[self.pos:end]
+            self.pos = end
+            return value, raw
+
+
+def iter_specialisms(f):
+    # Yields (specialism, payload, raw payload JSON) from a top-level JSON object
+    reader = _Reader(f)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        key, _ = reader.value()
+        reader.expect(":")
+        payload, raw = reader.value()
+        yield key, payload, raw
+        if reader.peek() == "}":
+            return
+        reader.expect(",")
+
+
+def dump_payload(payload) -> str:
+    # Same text as the payload inside json.dumps(content, indent=2, ensure_ascii=False)
+    return json.dumps(payload, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+
+
+# -------------------------------
+# Changes
+# -------------------------------
+def updated_payload(payload, master: list):
+    # -> (new payload, years that held their own conclusion) or (None, []) when unchanged
+    payload = payload if isinstance(payload, dict) else {}
+    years = payload.get("years")
+    if not isinstance(years, dict) or not years:
+        return None, []
+
+    stale_years = [year for year, year_payload in years.items()
+                   if not isinstance(year_payload, dict) or "conclusion" in year_payload]
+    if payload.get("conclusion") == master and not stale_years:
+        return None, []
+
+    # Stored once per specialism; every year inherits it (see content_store.py)
+    new_years = {
+        year: {k: v for k, v in year_payload.items() if k != "conclusion"} if isinstance(year_payload, dict) else {}
+        for year, year_payload in years.items()
+    }
+    rest = {k: v for k, v in payload.items() if k not in ("conclusion", "years")}
+    return {"conclusion": list(master), **rest, "years": new_years}, stale_years
+
+
+def payload_diff(path: Path, specialism: str, before, after) -> str:
+    return "".join(difflib.unified_diff(
+        dump_payload(before).splitlines(keepends=True),
+        dump_payload(after).splitlines(keepends=True),
+        fromfile=f"{path.name}: {specialism}",
+        tofile=f"{path.name}: {specialism} (updated)",
+    ))
+
+
 def main():
-    if not JSON_PATH.exists():
-        raise SystemExit(f"Missing: {JSON_PATH.resolve()}")
+    parser = argparse.ArgumentParser(description="Store each specialism's master conclusion in content.json.")
+    parser.add_argument("--source", type=Path, default=JSON_PATH)
+    parser.add_argument("--dry-run", action="store_true", help="print a diff of what would change, write nothing")
+    args = parser.parse_args()
 
-    content = json.loads(JSON_PATH.read_text(encoding="utf-8"))
+    path = args.source
+    if not path.exists():
+        raise SystemExit(f"Missing: {path.resolve()}")
 
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
     updated_specialisms = 0
     updated_years = 0
+    unchanged = 0
     missing = []
 
-    for specialism, payload in content.items():
-        master = MASTER_CONCLUSIONS.get(specialism)
-        if not master:
-            missing.append(specialism)
-            continue
+    # Everything is streamed into a temp file next to the source and swapped in with
+    # one rename at the end, so readers see either the old file or the new one.
+    with open(path, encoding="utf-8") as src, \
+            (open(os.devnull, "w", encoding="utf-8") if args.dry_run else open(tmp_path, "w", encoding="utf-8")) as out:
+        written = 0
+        out.write("{")
+        try:
+            for specialism, payload, raw in iter_specialisms(src):
+                out.write(("," if written else "") + "\n  " + json.dumps(specialism, ensure_ascii=False) + ": ")
+                written += 1
 
-        years = (payload or {}).get("years") or {}
-        if not isinstance(years, dict) or not years:
-            continue
+                master = MASTER_CONCLUSIONS.get(specialism)
+                if not master:
+                    missing.append(specialism)
+                    out.write(raw)
+                    continue
 
-        for year_key, year_payload in years.items():
-            if not isinstance(year_payload, dict):
-                years[year_key] = {}
-                year_payload = years[year_key]
+                new_payload, stale_years = updated_payload(payload, master)
+                if new_payload is None:
+                    unchanged += 1
+                    out.write(raw)
+                    continue
 
-            year_payload["conclusion"] = deepcopy(master)
-            updated_years += 1
+                out.write(dump_payload(new_payload))
+                updated_specialisms += 1
+                updated_years += len(stale_years)
+                if args.dry_run:
+                    print(payload_diff(path, specialism, payload, new_payload), end="")
+            out.write("\n}" if written else "}")
+        except BaseException:
+            out.close()
+            if not args.dry_run:
+                tmp_path.unlink(missing_ok=True)
+            raise
 
-        updated_specialisms += 1
+        if not args.dry_run and updated_specialisms:
+            out.flush()
+            os.fsync(out.fileno())
 
-    JSON_PATH.write_text(json.dumps(content, indent=2, ensure_ascii=False), encoding="utf-8")
+    if args.dry_run:
+        print(f"🔎 Dry run: {updated_specialisms} specialisms would change ({updated_years} years), {unchanged} unchanged.")
+    elif updated_specialisms:
+        tmp_path.replace(path)
+        print(f"✅ Updated conclusions for {updated_specialisms} specialisms ({updated_years} years); {unchanged} already up to date.")
+        print("   Rebuild the compiled/sharded artifacts with compile_content.py.")
+    else:
+        tmp_path.unlink(missing_ok=True)
+        print(f"✅ Already up to date ({unchanged} specialisms); {path.name} left untouched.")
 
-    print(f"✅ Updated conclusions for {updated_specialisms} specialisms across {updated_years} years.")
     if missing:
         print("⚠️ No master conclusion found for these specialisms (names must match exactly):")
         for m in missing:
             print(f" - {m}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,70 @@
+import base64
+import functools
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+STATIC_DIR = BASE_DIR / "static"
+
+# Smaller copies of the background for narrow viewports, largest first.
+# Regenerate with build_assets.py after changing assets/bg1.jpg.
+VARIANT_WIDTHS = (1280, 640)
+
+SELECTOR = '[data-testid="stAppViewContainer"]'
+
+
+def variant_name(image_path: Path, width: int = None) -> str:
+    return f"{image_path.stem}-{width}{image_path.suffix}" if width else image_path.name
+
+
+@functools.lru_cache(maxsize=None)
+def inline_css(image_path: Path) -> str:
+    # Fallback when static serving is off: encoded once per process, not per rerun
+    encoded = base64.b64encode(image_path.read_bytes()).decode()
+    return f"""
+    <style>
+    {SELECTOR} {{
+        background-image: url("data:image/jpg;base64,{encoded}") !important;
+        background-size: cover !important;
+        background-position: center !important;
+        background-attachment: fixed !important;
+    }}
+    </style>
+    """
+
+
+def variant_rules(image_path: Path, base_url: str, selector: str = SELECTOR) -> str:
+    # CSS rules for the full-size image plus a smaller variant per max-width breakpoint
+    queries = "".join(
+        f"""
+    @media (max-width: {width}px) {{
+        {selector} {{ background-image: url("{base_url}{variant_name(image_path, width)}") !important; }}
+    }}"""
+        for width in VARIANT_WIDTHS
+    )
+    return f"""
+    {selector} {{
+        background-image: url("{base_url}{variant_name(image_path)}") !important;
+        background-size: cover !important;
+        background-position: center !important;
+        background-attachment: fixed !important;
+    }}{queries}
+    """
+
+
+@functools.lru_cache(maxsize=None)
+def static_css(image_path: Path) -> str:
+    # Served from static/ so browsers cache it; narrow viewports get a smaller variant
+    return f"""
+    <style>{variant_rules(image_path, "app/static/")}</style>
+    """
+
+
+def has_static_variants(image_path: Path) -> bool:
+    names = [variant_name(image_path)] + [variant_name(image_path, w) for w in VARIANT_WIDTHS]
+    return all((STATIC_DIR / name).exists() for name in names)
+
+
+def background_css(image_path: Path, static_serving: bool) -> str:
+    if static_serving and has_static_variants(image_path):
+        return static_css(image_path)
+    return inline_css(image_path)
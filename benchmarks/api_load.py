@@ -0,0 +1,159 @@
+"""Load test for api_server.py: requests/sec and latency over keep-alive connections.
+
+Starts the API on a free local port (or targets --url), then runs --connections
+concurrent HTTP/1.1 keep-alive clients for --duration seconds over a mix of
+/niches, /niches/{niche}/years and /niches/{niche}/years/{year}.
+
+    python -m benchmarks.api_load [--connections 32] [--duration 10] [--gzip] [--conditional] [--url http://host:port]
+"""
+import argparse
+import asyncio
+import json
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from urllib.parse import quote, urlsplit
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_until_up(url: str, timeout: float = 30.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with urllib.request.urlopen(url + "/niches", timeout=2) as r:
+                return json.loads(r.read())
+        except OSError:
+            if time.monotonic() > deadline:
+                raise SystemExit(f"❌ API did not come up at {url}")
+            time.sleep(0.2)
+
+
+def request_paths(catalogue: dict) -> list:
+    paths = ["/niches"]
+    for niche in catalogue["niches"]:
+        base = "/niches/" + quote(niche["name"], safe="")
+        paths.append(base + "/years")
+        paths += [f"{base}/years/{year}" for year in niche["years"]]
+    return paths
+
+
+async def read_response(reader) -> tuple:
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("connection closed")
+    status = int(status_line.split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", 0))
+    if length:
+        await reader.readexactly(length)
+    return status, headers
+
+
+async def client(host: str, port: int, paths: list, deadline: float, args, stats: dict, seed: int) -> None:
+    rng = random.Random(seed)
+    etags = {}
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            path = rng.choice(paths)
+            lines = [f"GET {path} HTTP/1.1", f"Host: {host}:{port}", "Connection: keep-alive"]
+            if args.gzip:
+                lines.append("Accept-Encoding: gzip")
+            if args.conditional and path in etags:
+                lines.append(f"If-None-Match: {etags[path]}")
+            start = time.perf_counter()
+            writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+            status, headers = await read_response(reader)
+            stats["latencies"].append(time.perf_counter() - start)
+            stats["status"][status] = stats["status"].get(status, 0) + 1
+            if "etag" in headers:
+                etags[path] = headers["etag"]
+    finally:
+        writer.close()
+
+
+def percentile(samples: list, p: float) -> float:
+    return samples[min(len(samples) - 1, int(p / 100 * len(samples)))] if samples else 0.0
+
+
+async def run(url: str, paths: list, args) -> dict:
+    parts = urlsplit(url)
+    stats = {"latencies": [], "status": {}}
+    start = time.perf_counter()
+    deadline = start + args.duration
+    await asyncio.gather(*(
+        client(parts.hostname, parts.port or 80, paths, deadline, args, stats, seed)
+        for seed in range(args.connections)
+    ))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(stats["latencies"])
+    return {
+        "url": url,
+        "connections": args.connections,
+        "duration_s": round(elapsed, 2),
+        "gzip": args.gzip,
+        "conditional": args.conditional,
+        "requests": len(latencies),
+        "requests_per_s": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(1000 * percentile(latencies, 50), 3),
+        "p95_ms": round(1000 * percentile(latencies, 95), 3),
+        "p99_ms": round(1000 * percentile(latencies, 99), 3),
+        "status": {str(k): v for k, v in sorted(stats["status"].items())},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="target a running API instead of starting one")
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--gzip", action="store_true", help="send Accept-Encoding: gzip")
+    parser.add_argument("--conditional", action="store_true", help="revalidate with If-None-Match (expect 304s)")
+    parser.add_argument("--out", type=Path, help="also write the result as JSON")
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        port = free_port()
+        url = f"http://127.0.0.1:{port}"
+        server = subprocess.Popen([sys.executable, "api_server.py", "--port", str(port)], cwd=REPO_DIR)
+
+    try:
+        paths = request_paths(wait_until_up(url))
+        result = asyncio.run(run(url, paths, args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(
+        f"{result['requests']} requests over {result['connections']} connections in {result['duration_s']}s: "
+        f"{result['requests_per_s']:,.0f} req/s, p50 {result['p50_ms']:.2f} ms, "
+        f"p95 {result['p95_ms']:.2f} ms, p99 {result['p99_ms']:.2f} ms, status {result['status']}"
+    )
+    if args.out:
+        args.out.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+        print(f"✅ Wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Compressed content bundle vs content.json: bytes read, load time and parse memory.
+
+    python -m benchmarks.bundle_bench [--scales 1 100] [--repeats 5] [--out bundle-results.json]
+
+For each scale a synthetic content.json (pretty-printed, as apply_master_conclusions.py
+writes it) and its bundle are written to a temp dir. Measured per load path:
+bytes read from disk (/proc/self/io where available, file size otherwise), parse
+time and peak traced memory (read + decode + json, no cleaning), and the full
+cold open the store does when there are no cleaned artifacts (parse + clean_text).
+"""
+import argparse
+import gzip
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import content_bundle
+import content_store
+from benchmarks.suite import synthesize
+
+
+def bytes_read() -> int:
+    try:
+        with open("/proc/self/io", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("rchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+def measure(fn, repeats: int) -> dict:
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    before = bytes_read()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    after = bytes_read()
+    return {
+        "median_ms": round(1000 * statistics.median(times), 1),
+        "peak_mb": round(peak / (1024 * 1024), 2),
+        "bytes_read": after - before if before is not None else None,
+    }
+
+
+def run_scale(content: dict, scale: int, repeats: int) -> dict:
+    with tempfile.TemporaryDirectory(prefix=f"wayback-bundle-{scale}x-") as tmp:
+        path = Path(tmp) / "content.json"
+        path.write_text(json.dumps(content, indent=2, ensure_ascii=False), encoding="utf-8")
+        raw = path.read_bytes()
+        key = content_store.stat_key(path)
+
+        start = time.perf_counter()
+        bundle = content_store.build_bundle_artifact(raw, key)
+        build_s = time.perf_counter() - start
+        bundle_path = content_store.bundle_path_for(path)
+        bundle_path.write_bytes(bundle)
+        meta = content_bundle.read_meta(bundle_path)
+
+        json_source = lambda: content_store._Source(path, key)
+        bundle_source = lambda: content_store._BundleSource(bundle_path, key, meta)
+
+        result = {
+            "scale": scale,
+            "specialisms": len(content),
+            "json_bytes": len(raw),
+            "bundle_bytes": len(bundle),
+            "dictionary_bytes": len(content_bundle.train_dictionary(content)),
+            "gzip9_bytes": len(gzip.compress(raw, 9, mtime=0)),
+            "ratio": round(len(raw) / len(bundle), 1),
+            "build_s": round(build_s, 2),
+            "parse_json": measure(lambda: json_source().content(), repeats),
+            "parse_bundle": measure(lambda: bundle_source().content(), repeats),
+            "open_json": measure(lambda: content_store._open_raw(json_source()), max(1, repeats // 2)),
+            "open_bundle": measure(lambda: content_store._open_raw(bundle_source()), max(1, repeats // 2)),
+        }
+        if bundle_source().content() != json_source().content():
+            raise SystemExit(f"❌ {scale}x: bundle content differs from content.json")
+        check_truncated(path, bundle, key, json_source().content(), scale)
+        return result
+
+
+def check_truncated(path: Path, bundle: bytes, key: tuple, expected: dict, scale: int) -> None:
+    # A bundle cut short after its header still matches content.json's stat: the
+    # store must read content.json instead, and only fail when the bundle is all there is
+    bundle_path = content_store.bundle_path_for(path)
+    bundle_path.write_bytes(bundle[: len(bundle) - len(bundle) // 3])
+    source = content_store._open_source(path, key)
+    if not isinstance(source, content_store._BundleSource) or source.content() != expected:
+        raise SystemExit(f"❌ {scale}x: truncated bundle did not fall back to content.json")
+
+    moved = path.with_suffix(".json.bak")
+    path.rename(moved)
+    try:
+        content_store._open_source(path, key).content()
+    except ValueError:
+        pass
+    else:
+        raise SystemExit(f"❌ {scale}x: truncated bundle without content.json was read")
+    finally:
+        moved.rename(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 100])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--out", type=Path, help="also write the results as JSON")
+    args = parser.parse_args()
+
+    if not content_store.DATA_PATH.exists():
+        raise SystemExit(f"❌ Missing {content_store.DATA_PATH}")
+    content = json.loads(content_store.DATA_PATH.read_text(encoding="utf-8"))
+
+    results = []
+    for scale in args.scales:
+        print(f"⏱️ {scale}x ...", file=sys.stderr)
+        result = run_scale(content if scale == 1 else synthesize(content, scale), scale, args.repeats)
+        results.append(result)
+
+        print(
+            f"{scale}x ({result['specialisms']} specialisms): content.json {result['json_bytes']:,} B, "
+            f"bundle {result['bundle_bytes']:,} B ({result['ratio']}x, dictionary {result['dictionary_bytes']:,} B; "
+            f"gzip -9 of the file {result['gzip9_bytes']:,} B), built in {result['build_s']}s"
+        )
+        print(f"  {'load path':<14}{'bytes read':>13}{'median ms':>11}{'peak MB':>9}")
+        for name in ("parse_json", "parse_bundle", "open_json", "open_bundle"):
+            row = result[name]
+            read = f"{row['bytes_read']:,}" if row["bytes_read"] is not None else "n/a"
+            print(f"  {name:<14}{read:>13}{row['median_ms']:>11.1f}{row['peak_mb']:>9.2f}")
+
+    if args.out:
+        args.out.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"✅ Wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
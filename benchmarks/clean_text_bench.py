@@ -0,0 +1,41 @@
+"""Throughput benchmark: original regex-chain clean_text vs the fused normaliser.
+
+    python -m benchmarks.clean_text_bench [--repeat 20]
+"""
+import argparse
+import json
+import time
+
+import content_store
+from benchmarks.clean_text_diff import corpus_strings
+from benchmarks.legacy_clean_text import legacy_clean_text
+from normaliser import clean_text
+
+
+def strings_per_second(fn, strings: list, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for s in strings:
+            fn(s)
+        best = min(best, time.perf_counter() - start)
+    return len(strings) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="best-of-N timing runs")
+    args = parser.parse_args()
+
+    content = json.loads(content_store.DATA_PATH.read_text(encoding="utf-8"))
+    strings = list(corpus_strings(content))
+
+    legacy = strings_per_second(legacy_clean_text, strings, args.repeat)
+    fused = strings_per_second(clean_text, strings, args.repeat)
+
+    print(f"{len(strings)} strings from {content_store.DATA_PATH.name}, best of {args.repeat}")
+    print(f"  legacy clean_text: {legacy:>10,.0f} strings/sec")
+    print(f"  normaliser:        {fused:>10,.0f} strings/sec  ({fused / legacy:.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Differential check: normaliser.clean_text must match the original clean_text byte for byte.
+
+Runs over every string in data/content.json plus a seeded fuzz corpus built from the
+fragments the rules care about (quarters, units, decimals, $, dashes, acronyms, odd
+unicode). Exits non-zero and prints the first mismatches on any difference.
+
+    python -m benchmarks.clean_text_diff [--fuzz 50000] [--seed 0]
+"""
+import argparse
+import json
+import random
+
+import content_store
+from benchmarks.legacy_clean_text import legacy_clean_text
+from normaliser import clean_text
+
+FRAGMENTS = [
+    " ", "  ", "   ", "\t", "\n", "\xa0", ".", ". ", ",", ";", "(", ")", "'",
+    "0", "1", "3", "4", "5", "6", "9", "12", "2016", "2026", "653", "\u0663", "\uff13",
+    "Q", "q", "FY", "fy", "in", "In", "ai", "AI", "Ai", "aid", "said",
+    "G", "g", "GHz", "ghz", "T", "B", "M", "K", "%", "x", "kb",
+    "DDo", "DDO", "S", "s", "SD", "sd", "-", " - ", "WAN", "wan", "SASE",
+    "$", "—", "–", "\u200b", "\ufeff", "\ufb01", "\u2168", "\u017f", "\u0130", "\u0131",
+    "\u212a", "network", "the",
+]
+
+
+def corpus_strings(obj):
+    if isinstance(obj, dict):
+        for v in obj.values():
+            yield from corpus_strings(v)
+    elif isinstance(obj, list):
+        for v in obj:
+            yield from corpus_strings(v)
+    elif isinstance(obj, str):
+        yield obj
+
+
+def fuzz_strings(count: int, seed: int, corpus: list):
+    rng = random.Random(seed)
+    for i in range(count):
+        fragments = [rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 24))]
+        if corpus and i % 4 == 0:
+            # Splice the fragments into a real paragraph so rules see realistic context
+            base = rng.choice(corpus)
+            at = rng.randint(0, len(base))
+            yield base[:at] + "".join(fragments) + base[at:]
+        else:
+            yield "".join(fragments)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fuzz", type=int, default=50000, help="number of fuzz strings")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    content = json.loads(content_store.DATA_PATH.read_text(encoding="utf-8"))
+    corpus = list(corpus_strings(content))
+    cases = corpus + list(fuzz_strings(args.fuzz, args.seed, corpus))
+
+    mismatches = [(s, legacy_clean_text(s), clean_text(s)) for s in cases]
+    mismatches = [m for m in mismatches if m[1] != m[2]]
+
+    if mismatches:
+        print(f"❌ {len(mismatches)} of {len(cases)} strings differ. First few:")
+        for s, expected, got in mismatches[:10]:
+            print(f" input:    {s!r}\n expected: {expected!r}\n got:      {got!r}\n")
+        raise SystemExit(1)
+
+    print(f"✅ Byte-identical on {len(corpus)} content strings + {args.fuzz} fuzz strings.")
+
+if __name__ == "__main__":
+    main()
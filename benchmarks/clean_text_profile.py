@@ -0,0 +1,100 @@
+"""Per-rule profile of clean_text over the corpus: which rules fire, what they cost.
+
+For every normaliser step: how often its guard let it run, strings changed,
+substitutions that changed the text, total and worst-case time (with the input that
+caused it) and a few before/after examples. Fused rules are broken down by branch
+(e.g. token_join into its Q-number, DDoS and SD-WAN joins), and rules or branches
+that never fire are listed as dead. --fail-over-ms exits non-zero when any single
+rule application is slower, to catch content that sends a regex down a pathological
+path before it ships.
+
+    python -m benchmarks.clean_text_profile [--fuzz 0] [--out clean_text_profile.json] [--fail-over-ms 5]
+"""
+import argparse
+import json
+from pathlib import Path
+
+import content_store
+from benchmarks.clean_text_diff import corpus_strings, fuzz_strings
+from normaliser import BRANCH_OF, clean_text, new_profiles, profile_clean_text
+
+
+def report_rows(profiles: dict, strings: int) -> list:
+    rows = []
+    for profile in profiles.values():
+        rows.append({
+            "rule": profile.name,
+            "branch_of": BRANCH_OF.get(profile.name),
+            "ran": profile.calls,
+            "guarded_out": profile.skipped,
+            "strings_changed": profile.changed,
+            "hits": profile.hits,
+            "total_ms": round(1000 * profile.seconds, 3),
+            "mean_us": round(1e6 * profile.seconds / profile.calls, 3) if profile.calls else 0.0,
+            "max_ms": round(1000 * profile.slowest, 3),
+            "max_input": profile.slowest_input[:300],
+            "share_of_strings": round(profile.changed / strings, 4) if strings else 0.0,
+            "examples": [{"before": b, "after": a} for b, a in profile.examples],
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--source", type=Path, default=content_store.DATA_PATH)
+    parser.add_argument("--fuzz", type=int, default=0, help="also profile N generated strings")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--examples", type=int, default=3, help="before/after examples kept per rule")
+    parser.add_argument("--out", type=Path, default=Path("clean_text_profile.json"))
+    parser.add_argument("--fail-over-ms", type=float, help="exit 1 if any single rule application is slower")
+    args = parser.parse_args()
+
+    content = json.loads(args.source.read_text(encoding="utf-8"))
+    strings = list(corpus_strings(content))
+    if args.fuzz:
+        strings += fuzz_strings(args.fuzz, args.seed, strings)
+
+    profiles = new_profiles()
+    for s in strings:
+        if profile_clean_text(s, profiles, args.examples) != clean_text(s):
+            raise SystemExit("❌ profile_clean_text is out of step with clean_text")
+
+    rows = report_rows(profiles, len(strings))
+    # Branch times are stand-alone scans, already paid for inside their fused rule
+    total_ms = sum(row["total_ms"] for row in rows if not row["branch_of"])
+    fused = set(BRANCH_OF.values())
+    dead = [row["rule"] for row in rows if not row["hits"] and row["rule"] not in fused]
+
+    print(f"{len(strings)} strings from {args.source.name}" + (f" (+{args.fuzz} fuzz)" if args.fuzz else ""))
+    print(f"  {'rule':<22} {'ran':>7} {'changed':>8} {'hits':>7} {'total ms':>9} {'mean us':>8} {'max ms':>7}")
+    for row in rows:
+        name = f"  {row['rule']}" if row["branch_of"] else row["rule"]
+        print(
+            f"  {name:<22} {row['ran']:>7} {row['strings_changed']:>8} {row['hits']:>7} "
+            f"{row['total_ms']:>9.2f} {row['mean_us']:>8.2f} {row['max_ms']:>7.3f}"
+        )
+    print(f"  total {total_ms:.1f} ms")
+    if dead:
+        print("⚠️  Never fired: " + ", ".join(dead))
+
+    report = {
+        "source": str(args.source),
+        "strings": len(strings),
+        "fuzz": args.fuzz,
+        "total_ms": round(total_ms, 3),
+        "dead_rules": dead,
+        "rules": rows,
+    }
+    args.out.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    print(f"✅ Wrote {args.out}")
+
+    if args.fail_over_ms is not None:
+        slow = [row for row in rows if row["max_ms"] > args.fail_over_ms]
+        if slow:
+            for row in slow:
+                print(f"❌ {row['rule']} took {row['max_ms']:.2f} ms on: {row['max_input'][:120]!r}")
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Frozen copy of the original regex-chain clean_text from app.py.
+
+This is the reference the fused normaliser in normaliser.py must match byte for byte.
+Do not edit it to "fix" behaviour; change normaliser.py and CLEANER_VERSION instead.
+"""
+import re
+import unicodedata
+
+ZERO_WIDTH = dict.fromkeys(map(ord, ["\u200B", "\u200C", "\u200D", "\uFEFF"]), None)
+
+def legacy_clean_text(s: str) -> str:
+    if not isinstance(s, str):
+        return s
+
+    s = unicodedata.normalize("NFKC", s)
+    s = s.translate(ZERO_WIDTH)
+
+    # Remove em/en dashes
+    s = s.replace("—", "-").replace("–", "-")
+
+    # Escape $ so Streamlit doesn't trigger math mode
+    s = s.replace("$", "&#36;")
+
+    # Fix missing space after full stop
+    s = re.sub(r"\.([A-Za-z0-9])", r". \1", s)
+
+    # Fix glued digit-letter boundaries
+    s = re.sub(r"(\d)([A-Za-z])", r"\1 \2", s)
+    s = re.sub(r"([A-Za-z])(\d)", r"\1 \2", s)
+
+    # Fix quarters: "Q 1" -> "Q1" (case-insensitive)
+    s = re.sub(r"\bQ\s+([1-4])\b", r"Q\1", s, flags=re.IGNORECASE)
+    s = re.sub(r"\bFY\s+(\d{2,4})\b", r"FY\1", s, flags=re.IGNORECASE)  # optional
+
+    # Fix in2026
+    s = re.sub(r"\bin(?=\d{4}\b)", "in ", s)
+
+    # -----------------------------
+    # FIX ALL DECIMAL SPACING
+    # "653. 4" → "653.4"
+    # "6. 15" → "6.15"
+    # -----------------------------
+    s = re.sub(r"(\d+)\.\s+(\d+)", r"\1.\2", s)
+
+    # -----------------------------
+    # FIX NUMBER + UNIT SPACING
+    # "3.7 T" → "3.7T"
+    # "653.4 B" → "653.4B"
+    # "12.5 %" → "12.5%"
+    # -----------------------------
+    s = re.sub(r"(\d+(?:\.\d+)?)\s*(T|B|M|K|%)\b", r"\1\2", s)
+
+    # -----------------------------
+    # FIX CURRENCY SPACING
+    # "$ 3.7T" → "$3.7T"
+    # -----------------------------
+    s = re.sub(r"\$\s*(\d)", r"$\1", s)
+
+    # -----------------------------
+    # FIX AI casing globally
+    # -----------------------------
+    s = re.sub(r"\bai\b", "AI", s, flags=re.IGNORECASE)
+
+    # Collapse multiple spaces
+    s = re.sub(r"[ ]{2,}", " ", s)
+
+    # Re-join common tech tokens that should NOT be split
+    # 3G/4G/5G/6G, 5GHz, Q1-Q4, DDoS, SASE, SD-WAN, etc.
+
+    # Join digit + G patterns: "5 G" -> "5G"
+    s = re.sub(r"\b([3-6])\s+G\b", r"\1G", s)
+
+    # Join GHz patterns: "5 GHz" -> "5GHz"
+    s = re.sub(r"\b(\d+)\s+GHz\b", r"\1GHz", s, flags=re.IGNORECASE)
+
+    # Join quarter tokens: "Q 1" -> "Q1"
+    s = re.sub(r"\bQ\s*([1-4])\b", r"Q\1", s, flags=re.IGNORECASE)
+
+    # Fix DDoS: "DDo S" -> "DDoS"
+    s = re.sub(r"\bDDo\s+S\b", "DDoS", s)
+
+    # Fix common split acronyms like "S D-W A N" edge cases (light touch)
+    s = re.sub(r"\bSD\s*-\s*WAN\b", "SD-WAN", s, flags=re.IGNORECASE)
+    s = re.sub(r"\bSASE\b", "SASE", s)  # no-op but keeps intent clear
+
+    return s.strip()
@@ -0,0 +1,314 @@
+"""Concurrent-session load test for app.py: rerun latency, memory per session, websocket bytes.
+
+Starts `streamlit run app.py` on a free local port (or targets --url), then opens
+--sessions headless sessions over the same websocket protocol the browser uses and
+drives each through a realistic flow: load the page, pick a specialism, scrub the
+year slider a few steps, switch specialism, scrub again...
+
+Reports rerun latency percentiles per interaction, the server's RSS with the
+sessions open and the marginal RSS per session (slope over --ramp-steps batches),
+and ForwardMsg bytes per interaction. Linux only for RSS (/proc).
+
+    python -m benchmarks.session_load [--sessions 20] [--interactions 20] [--think 0.2] [--query slider=client] [--url http://host:port --pid PID]
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+from benchmarks.api_load import free_port, percentile
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+NICHE_LABEL = "Choose a Specialism"
+SLIDER_LABEL = "Range Slider"
+
+FAILED = {ForwardMsg.FINISHED_WITH_COMPILE_ERROR}
+
+
+def rss_mb(pid: int):
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+
+def wait_until_up(url: str, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with urllib.request.urlopen(url + "/_stcore/health", timeout=2) as r:
+                if r.status == 200:
+                    return
+        except OSError:
+            pass
+        if time.monotonic() > deadline:
+            raise SystemExit(f"❌ Streamlit did not come up at {url}")
+        time.sleep(0.3)
+
+
+# -------------------------------
+# One headless browser session
+# -------------------------------
+class Session:
+    def __init__(self, ws_url: str, query: str, stats: dict, seed: int) -> None:
+        self.ws_url = ws_url
+        self.query = query
+        self.stats = stats
+        self.rng = random.Random(seed)
+        self.ws = None
+        self.widgets = {}  # label -> [widget id, fragment id, kind, value, options/range]
+        self.cached = set()  # hashes of cacheable messages, reported back like the browser does
+
+    async def open(self) -> None:
+        self.ws = await websockets.connect(self.ws_url, subprotocols=["streamlit"], max_size=None)
+        await self.rerun("load")
+
+    async def close(self) -> None:
+        if self.ws is not None:
+            await self.ws.close()
+
+    def _back_msg(self, fragment_id: str) -> bytes:
+        msg = BackMsg()
+        state = msg.rerun_script
+        state.query_string = self.query
+        state.fragment_id = fragment_id
+        state.cached_message_hashes.extend(self.cached)
+        for widget_id, _, kind, value, _ in self.widgets.values():
+            widget = state.widget_states.widgets.add()
+            widget.id = widget_id
+            if kind == "selectbox":
+                widget.string_value = value
+            else:
+                widget.double_array_value.data.append(value)
+        return msg.SerializeToString()
+
+    def _track(self, msg) -> bool:
+        # Remembers widget ids/options; True if the run raised an exception
+        if msg.metadata.cacheable:
+            self.cached.add(msg.hash)
+        if msg.WhichOneof("type") != "delta" or msg.delta.WhichOneof("type") != "new_element":
+            return False
+        element = msg.delta.new_element
+        kind = element.WhichOneof("type")
+        if kind == "exception":
+            return True
+        if kind == "selectbox" and element.selectbox.label == NICHE_LABEL:
+            box = element.selectbox
+            previous = self.widgets.get(NICHE_LABEL)
+            value = previous[3] if previous else box.options[box.default]
+            self.widgets[NICHE_LABEL] = [box.id, msg.delta.fragment_id, kind, value, list(box.options)]
+        elif kind == "slider" and element.slider.label == SLIDER_LABEL:
+            slider = element.slider
+            previous = self.widgets.get(SLIDER_LABEL)
+            value = previous[3] if previous else slider.default[0]
+            value = min(max(value, slider.min), slider.max)
+            self.widgets[SLIDER_LABEL] = [slider.id, msg.delta.fragment_id, kind, value, (slider.min, slider.max)]
+        return False
+
+    async def rerun(self, action: str, fragment_id: str = "") -> None:
+        payload = self._back_msg(fragment_id)
+        received = 0
+        failed = False
+        start = time.perf_counter()
+        await self.ws.send(payload)
+        while True:
+            raw = await self.ws.recv()
+            received += len(raw)
+            msg = ForwardMsg()
+            msg.ParseFromString(raw)
+            failed |= self._track(msg)
+            if msg.WhichOneof("type") == "script_finished":
+                failed |= msg.script_finished in FAILED
+                break
+        self.stats["runs"].setdefault(action, []).append((time.perf_counter() - start, received, len(payload)))
+        self.stats["errors"] += failed
+
+    async def set_widget(self, label: str, value, action: str) -> None:
+        widget = self.widgets[label]
+        widget[3] = value
+        await self.rerun(action, widget[1])
+
+    async def browse(self, interactions: int, think: float) -> None:
+        for _ in range(interactions):
+            await asyncio.sleep(self.rng.uniform(0, 2 * think))
+            slider = self.widgets.get(SLIDER_LABEL)
+            # Mostly scrubbing, now and then a different specialism; with
+            # ?slider=client scrubbing stays in the browser and never reruns
+            if slider is None or self.rng.random() < 0.25:
+                niche = self.widgets[NICHE_LABEL]
+                await self.set_widget(NICHE_LABEL, self.rng.choice([o for o in niche[4] if o != niche[3]]), "switch_niche")
+            else:
+                low, high = slider[4]
+                step = self.rng.choice((-1, 1)) if low < slider[3] < high else (1 if slider[3] <= low else -1)
+                await self.set_widget(SLIDER_LABEL, slider[3] + step, "scrub")
+
+
+# -------------------------------
+# Run
+# -------------------------------
+async def sample_peak(pid: int, peak: list, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        rss = rss_mb(pid)
+        if rss is not None:
+            peak[0] = max(peak[0], rss)
+        await asyncio.sleep(0.1)
+
+
+async def run(url: str, pid, args) -> dict:
+    parts = urlsplit(url)
+    ws_url = f"ws://{parts.netloc}{parts.path.rstrip('/')}/_stcore/stream"
+    stats = {"runs": {}, "errors": 0}
+
+    # Warm-up: the first session imports the app's modules and loads content,
+    # which is per process, not per session
+    warm = Session(ws_url, args.query, {"runs": {}, "errors": 0}, seed=-1)
+    await warm.open()
+    await warm.close()
+    await asyncio.sleep(args.settle)
+
+    sessions = [Session(ws_url, args.query, stats, seed) for seed in range(args.sessions)]
+    ramp = [(0, rss_mb(pid) if pid else None)]
+    steps = max(1, min(args.ramp_steps, args.sessions))
+    for k in range(steps):
+        batch = sessions[k * args.sessions // steps:(k + 1) * args.sessions // steps]
+        await asyncio.gather(*(session.open() for session in batch))
+        await asyncio.sleep(args.settle)
+        ramp.append(((k + 1) * args.sessions // steps, rss_mb(pid) if pid else None))
+
+    peak = [ramp[-1][1] or 0.0]
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(sample_peak(pid, peak, stop)) if pid else None
+    start = time.perf_counter()
+    await asyncio.gather(*(session.browse(args.interactions, args.think) for session in sessions))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    if sampler:
+        await sampler
+    rss_after = rss_mb(pid) if pid else None
+    await asyncio.gather(*(session.close() for session in sessions))
+
+    actions = {}
+    for action, runs in sorted(stats["runs"].items()):
+        latencies = sorted(latency for latency, _, _ in runs)
+        actions[action] = {
+            "count": len(runs),
+            "p50_ms": round(1000 * percentile(latencies, 50), 1),
+            "p95_ms": round(1000 * percentile(latencies, 95), 1),
+            "p99_ms": round(1000 * percentile(latencies, 99), 1),
+            "max_ms": round(1000 * latencies[-1], 1),
+            "bytes_in": round(statistics.mean(received for _, received, _ in runs)),
+            "bytes_out": round(statistics.mean(sent for _, _, sent in runs)),
+        }
+
+    memory = {}
+    if all(rss is not None for _, rss in ramp):
+        xs, ys = zip(*ramp)
+        memory = {
+            "baseline_rss_mb": round(ys[0], 1),
+            "rss_with_sessions_mb": round(ys[-1], 1),
+            "rss_after_browsing_mb": round(rss_after, 1) if rss_after else None,
+            "peak_rss_mb": round(peak[0], 1),
+            "marginal_kb_per_session": round(1024 * statistics.linear_regression(xs, ys).slope, 1),
+            "ramp": [[n, round(rss, 1)] for n, rss in ramp],
+        }
+
+    interactions = sum(len(runs) for action, runs in stats["runs"].items() if action != "load")
+    return {
+        "url": url,
+        "query": args.query,
+        "sessions": args.sessions,
+        "interactions_per_session": args.interactions,
+        "think_s": args.think,
+        "duration_s": round(elapsed, 2),
+        "interactions_per_s": round(interactions / elapsed, 1),
+        "errors": stats["errors"],
+        "actions": actions,
+        "memory": memory,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="target a running app instead of starting one")
+    parser.add_argument("--pid", type=int, help="server process id for RSS when using --url")
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--interactions", type=int, default=20, help="reruns per session after the page load")
+    parser.add_argument("--think", type=float, default=0.2, help="mean pause between interactions (s)")
+    parser.add_argument("--ramp-steps", type=int, default=4, help="batches sessions are opened in, for the RSS slope")
+    parser.add_argument("--settle", type=float, default=1.0, help="pause before each RSS sample (s)")
+    parser.add_argument("--query", default="", help='query string for every session, e.g. "slider=client"')
+    parser.add_argument("--out", type=Path, help="also write the result as JSON")
+    args = parser.parse_args()
+
+    server = None
+    url, pid = args.url, args.pid
+    if url is None:
+        port = free_port()
+        url = f"http://127.0.0.1:{port}"
+        server = subprocess.Popen(
+            [
+                sys.executable, "-m", "streamlit", "run", "app.py",
+                "--server.headless", "true",
+                "--server.port", str(port),
+                "--server.enableXsrfProtection", "false",
+                "--server.fileWatcherType", "none",
+                "--browser.gatherUsageStats", "false",
+                "--logger.level", "error",
+            ],
+            cwd=REPO_DIR,
+            stdout=subprocess.DEVNULL,
+        )
+        pid = server.pid
+
+    try:
+        wait_until_up(url)
+        result = asyncio.run(run(url, pid, args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(
+        f"{result['sessions']} sessions x {result['interactions_per_session']} interactions in {result['duration_s']}s: "
+        f"{result['interactions_per_s']:,.1f} reruns/s, {result['errors']} errors"
+    )
+    print(f"{'action':<14}{'count':>7}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}{'bytes in':>10}{'bytes out':>11}")
+    for action, row in result["actions"].items():
+        print(
+            f"{action:<14}{row['count']:>7}{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}{row['p99_ms']:>9.1f}"
+            f"{row['max_ms']:>9.1f}{row['bytes_in']:>10,}{row['bytes_out']:>11,}"
+        )
+    memory = result["memory"]
+    if memory:
+        print(
+            f"RSS {memory['baseline_rss_mb']:.0f} MB warm -> {memory['rss_with_sessions_mb']:.0f} MB with "
+            f"{result['sessions']} sessions (peak {memory['peak_rss_mb']:.0f} MB), "
+            f"{memory['marginal_kb_per_session']:,.0f} KB per additional session"
+        )
+    else:
+        print("⚠️ No RSS figures (pass --pid with --url, Linux only)")
+    if result["errors"]:
+        print(f"⚠️ {result['errors']} runs raised an exception or failed to compile")
+    if args.out:
+        args.out.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+        print(f"✅ Wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
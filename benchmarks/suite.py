@@ -0,0 +1,249 @@
+"""App benchmark suite over synthetic content.json corpora at 1x, 10x and 100x.
+
+    python -m benchmarks.suite [--scales 1 10 100] [--reruns 20] [--artifacts] [--out bench-results.json]
+
+Each corpus is written into a throwaway copy of the app and measured in a fresh
+Python process, so every cold start really is cold: import time, the first
+AppTest run (store build + render), JSON load, walk/clean_text throughput,
+per-rerun latency for slider and specialism changes, and peak RSS.
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+# scale -> (niche copies, year multiplier, paragraph repetitions); the product is the scale
+SCALES = {
+    1: (1, 1, 1),
+    10: (5, 2, 1),
+    100: (10, 2, 5),
+}
+
+COPY_IGNORE = shutil.ignore_patterns(".git", "__pycache__", "benchmarks", "data", "*.jsonl")
+
+
+# -------------------------------
+# Synthetic corpora
+# -------------------------------
+def scale_factors(scale: int) -> tuple:
+    if scale in SCALES:
+        return SCALES[scale]
+    return (scale, 1, 1)
+
+
+def synthesize(content: dict, scale: int) -> dict:
+    niche_copies, year_multiplier, repetitions = scale_factors(scale)
+
+    def lengthen(blocks):
+        if not isinstance(blocks, list):
+            return blocks
+        return [" ".join([p] * repetitions) for p in blocks]
+
+    out = {}
+    for copy in range(niche_copies):
+        for niche, specialism in content.items():
+            years = specialism.get("years") or {}
+            numeric = sorted(int(y) for y in years if y.isdigit())
+            span = (numeric[-1] - numeric[0] + 1) if numeric else 0
+
+            # Extra years are earlier decades reusing the real ones: 2005-2015 mirrors 2016-2026
+            synthetic_years = {}
+            for shift in range(year_multiplier - 1, -1, -1):
+                for year, payload in years.items():
+                    key = str(int(year) - shift * span) if year.isdigit() else year
+                    synthetic_years[key] = {section: lengthen(blocks) for section, blocks in payload.items()}
+
+            name = niche if copy == 0 else f"{niche} {copy + 1}"
+            out[name] = {
+                **{k: lengthen(v) for k, v in specialism.items() if k != "years"},
+                "years": synthetic_years,
+            }
+    return out
+
+
+def make_tree(content: dict, scale: int, root: Path) -> Path:
+    # A copy of the app whose data/ holds the synthetic corpus
+    shutil.copytree(REPO_DIR, root, ignore=COPY_IGNORE, dirs_exist_ok=True)
+    data_path = root / "data" / "content.json"
+    data_path.parent.mkdir(parents=True, exist_ok=True)
+    data_path.write_text(json.dumps(synthesize(content, scale), ensure_ascii=False, indent=2), encoding="utf-8")
+    return data_path
+
+
+def count_strings(obj) -> int:
+    if isinstance(obj, dict):
+        return sum(count_strings(v) for v in obj.values())
+    if isinstance(obj, list):
+        return sum(count_strings(v) for v in obj)
+    return int(isinstance(obj, str))
+
+
+# -------------------------------
+# Worker (runs inside the synthetic tree, one process per corpus)
+# -------------------------------
+def summary(samples: list) -> dict:
+    samples = sorted(samples)
+    if not samples:
+        return {}
+    return {
+        "n": len(samples),
+        "mean_ms": round(1000 * statistics.fmean(samples), 3),
+        "p50_ms": round(1000 * samples[len(samples) // 2], 3),
+        "p95_ms": round(1000 * samples[min(len(samples) - 1, int(0.95 * len(samples)))], 3),
+        "max_ms": round(1000 * samples[-1], 3),
+    }
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def worker(root: Path, reruns: int) -> dict:
+    sys.path.insert(0, str(root))
+    os.chdir(root)
+
+    start = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+
+    import content_store
+    from normaliser import walk
+    import_s = time.perf_counter() - start
+
+    at = AppTest.from_file(str(root / "app.py"), default_timeout=900)
+    cold_start_s = timed(at.run)
+    if at.exception:
+        raise SystemExit(f"❌ app.py raised: {at.exception[0].message}")
+
+    slider = at.slider[0]
+    years = list(range(int(slider.min), int(slider.max) + 1))
+    slider_s = []
+    for i in range(reruns):
+        at.slider[0].set_value(years[(i + 1) % len(years)])
+        slider_s.append(timed(at.run))
+
+    niches = at.selectbox[0].options
+    niche_s = []
+    for i in range(reruns):
+        at.selectbox[0].select(niches[(i + 1) % len(niches)])
+        niche_s.append(timed(at.run))
+
+    raw = content_store.DATA_PATH.read_text(encoding="utf-8")
+    content = None
+
+    def load():
+        nonlocal content
+        content = json.loads(raw)
+
+    json_load_s = timed(load)
+    strings = count_strings(content)
+    walk_s = min(timed(lambda: walk(content)) for _ in range(3))
+
+    return {
+        "import_s": round(import_s, 4),
+        "cold_start_s": round(cold_start_s, 4),
+        "json_load_s": round(json_load_s, 4),
+        "walk_s": round(walk_s, 4),
+        "clean_text_strings_per_s": round(strings / walk_s) if walk_s else None,
+        "rerun_slider": summary(slider_s),
+        "rerun_niche": summary(niche_s),
+        # ru_maxrss is KiB on Linux, bytes on macOS
+        "peak_rss_mb": round(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1
+        ),
+    }
+
+
+# -------------------------------
+# Driver
+# -------------------------------
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def run_scale(content: dict, scale: int, reruns: int, artifacts: bool) -> dict:
+    with tempfile.TemporaryDirectory(prefix=f"wayback-bench-{scale}x-") as tmp:
+        root = Path(tmp)
+        data_path = make_tree(content, scale, root)
+        result = {
+            "scale": scale,
+            "factors": dict(zip(("niche_copies", "year_multiplier", "paragraph_repetitions"), scale_factors(scale))),
+            "content_bytes": data_path.stat().st_size,
+            "strings": count_strings(json.loads(data_path.read_text(encoding="utf-8"))),
+            "mode": "artifacts" if artifacts else "raw",
+        }
+
+        if artifacts:
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "compile_content.py", "--indexed"], cwd=root, check=True, capture_output=True)
+            result["compile_s"] = round(time.perf_counter() - start, 4)
+
+        proc = subprocess.run(
+            [sys.executable, "-m", "benchmarks.suite", "--worker", str(root), "--reruns", str(reruns)],
+            cwd=REPO_DIR, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            raise SystemExit(f"❌ {scale}x worker failed:\n{proc.stderr[-2000:]}")
+        result.update(json.loads(proc.stdout.strip().splitlines()[-1]))
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=sorted(SCALES))
+    parser.add_argument("--reruns", type=int, default=20, help="timed reruns per interaction")
+    parser.add_argument("--artifacts", action="store_true", help="build compiled/indexed artifacts before measuring")
+    parser.add_argument("--out", type=Path, default=Path("bench-results.json"))
+    parser.add_argument("--worker", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(worker(args.worker, args.reruns)))
+        return
+
+    # Synthesise from the source corpus as authored, before cleaning
+    source = REPO_DIR / "data" / "content.json"
+    content = json.loads(source.read_text(encoding="utf-8"))
+
+    results = []
+    for scale in args.scales:
+        print(f"⏱️  {scale}x ...", flush=True)
+        result = run_scale(content, scale, args.reruns, args.artifacts)
+        results.append(result)
+        print(
+            f"   {result['content_bytes'] / 1e6:.1f} MB, cold start {result['cold_start_s']:.2f}s, "
+            f"slider rerun p50 {result['rerun_slider']['p50_ms']:.0f} ms, "
+            f"niche rerun p50 {result['rerun_niche']['p50_ms']:.0f} ms, "
+            f"peak RSS {result['peak_rss_mb']:.0f} MB"
+        )
+
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    args.out.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"✅ Wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import argparse
+from pathlib import Path
+
+import background
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow ships with streamlit, but keep the error readable
+    Image = None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Write the background image and its resized variants to static/ for Streamlit static serving."
+    )
+    parser.add_argument("--image", type=Path, default=background.BASE_DIR / "assets" / "bg1.jpg")
+    parser.add_argument("--quality", type=int, default=75, help="JPEG quality for the resized variants")
+    args = parser.parse_args()
+
+    if Image is None:
+        raise SystemExit("Pillow is required: pip install pillow")
+    if not args.image.exists():
+        raise SystemExit(f"Missing: {args.image.resolve()}")
+
+    background.STATIC_DIR.mkdir(exist_ok=True)
+
+    full = background.STATIC_DIR / background.variant_name(args.image)
+    full.write_bytes(args.image.read_bytes())
+    print(f"✅ {full.name}: {full.stat().st_size // 1024} KB (original)")
+
+    with Image.open(args.image) as im:
+        im = im.convert("RGB")
+        for width in background.VARIANT_WIDTHS:
+            if width >= im.width:
+                print(f"⚠️ Skipping {width}px: source is only {im.width}px wide")
+                continue
+            height = round(im.height * width / im.width)
+            out = background.STATIC_DIR / background.variant_name(args.image, width)
+            im.resize((width, height), Image.LANCZOS).save(
+                out, "JPEG", quality=args.quality, optimize=True, progressive=True
+            )
+            print(f"✅ {out.name}: {width}x{height}, {out.stat().st_size // 1024} KB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+import difflib
+import re
+import threading
+from itertools import combinations, zip_longest
+
+import content_store
+import render
+
+# -------------------------------
+# Year-over-year comparison
+#
+# Two years of one niche side by side, per SECTION_ORDER section, with the words
+# that changed marked on each side. Paragraphs are paired by position and diffed
+# word by word with difflib. A comparison depends only on (niche content version,
+# niche, pair of years), so it is built once and shared by every session from an
+# LRU of its own; reloads drop only the niches they touched.
+# -------------------------------
+COMPARE_CACHE_SIZE = 1024
+
+WORD_RE = re.compile(r"\s+|\S+")
+
+COMPARE_CSS = """/* Year-over-year comparison */
+.glass-card mark.diff-removed {
+    background: rgba(214, 69, 65, 0.18);
+    text-decoration: line-through;
+    text-decoration-color: rgba(214, 69, 65, 0.6);
+    padding: 0 0.1em;
+    border-radius: 4px;
+}
+
+.glass-card mark.diff-added {
+    background: rgba(122, 192, 67, 0.28);
+    padding: 0 0.1em;
+    border-radius: 4px;
+}
+
+.glass-card .diff-empty {
+    color: rgba(49, 51, 63, 0.6);
+    font-style: italic;
+}
+"""
+
+DIFFS = render.RenderCache(COMPARE_CACHE_SIZE)
+
+
+def _marked(words: list, changed: list, css_class: str) -> str:
+    # Runs of changed words, with the spaces between them, become one <mark>.
+    # Paragraphs are already cleaned HTML, so words are emitted as they are.
+    last = len(words) - 1
+    for i, word in enumerate(words):
+        if word.isspace():
+            changed[i] = 0 < i < last and changed[i - 1] and changed[i + 1]
+
+    out = []
+    for i, word in enumerate(words):
+        if changed[i] and (i == 0 or not changed[i - 1]):
+            out.append(f'<mark class="{css_class}">')
+        out.append(word)
+        if changed[i] and (i == last or not changed[i + 1]):
+            out.append("</mark>")
+    return "".join(out)
+
+
+def paragraph_diff(before: str, after: str) -> tuple:
+    # -> (before html, after html) with removed/added words marked
+    a, b = WORD_RE.findall(before), WORD_RE.findall(after)
+    changed_a, changed_b = [False] * len(a), [False] * len(b)
+    matcher = difflib.SequenceMatcher(None, a, b, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != "equal":
+            changed_a[i1:i2] = [True] * (i2 - i1)
+            changed_b[j1:j2] = [True] * (j2 - j1)
+    return _marked(a, changed_a, "diff-removed"), _marked(b, changed_b, "diff-added")
+
+
+def section_diff(before: tuple, after: tuple) -> tuple:
+    # -> (before card html, after card html, changed?)
+    left, right = [], []
+    for a, b in zip_longest(before, after):
+        if a is None:
+            right.append(f'<mark class="diff-added">{b}</mark>')
+        elif b is None:
+            left.append(f'<mark class="diff-removed">{a}</mark>')
+        else:
+            a_html, b_html = paragraph_diff(a, b)
+            left.append(a_html)
+            right.append(b_html)
+    empty = ['<span class="diff-empty">Nothing this year.</span>']
+    return (
+        render.glass_card_html(left or empty),
+        render.glass_card_html(right or empty),
+        tuple(before) != tuple(after),
+    )
+
+
+def _compare_view(before, after) -> tuple:
+    # -> ((section title, before card, after card, changed?), ...) for sections either year has
+    return tuple(
+        (title, *section_diff(before[key], after[key]))
+        for key, title in render.SECTION_ORDER
+        if before[key] or after[key]
+    )
+
+
+def compared_years(store, niche: str, year_a: str, year_b: str) -> tuple:
+    return DIFFS.get(
+        (store.niche_version(niche), "compare", niche, year_a, year_b),
+        lambda: _compare_view(store.get_year_payload(niche, year_a), store.get_year_payload(niche, year_b)),
+    )
+
+
+def prewarm(store, niche: str) -> int:
+    # Every (earlier, later) pair of one niche's years, so picking any pair is a cache hit
+    years = store.available_years_for(niche)
+    for year_a, year_b in combinations(years, 2):
+        compared_years(store, niche, year_a, year_b)
+    return len(years) * (len(years) - 1) // 2
+
+
+_lock = threading.Lock()
+_prewarmed = set()  # (niche content version, niche)
+
+
+def prewarm_in_background(store, niche: str) -> None:
+    # The pair on screen is diffed on demand; the niche's other pairs follow in a
+    # daemon thread, once per niche content version, so the next pick is instant
+    key = (store.niche_version(niche), niche)
+    with _lock:
+        if key in _prewarmed:
+            return
+        _prewarmed.add(key)
+    threading.Thread(target=prewarm, args=(store, niche), name=f"compare-prewarm:{niche}", daemon=True).start()
+
+
+def _on_reload(previous, store, changed) -> None:
+    DIFFS.discard_niches(changed)
+    with _lock:
+        _prewarmed.difference_update([key for key in _prewarmed if key[1] in changed])
+
+
+content_store.on_reload(_on_reload)
@@ -0,0 +1,94 @@
+import argparse
+import json
+from pathlib import Path
+
+import content_store
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+
+
+def write_json_atomic(path: Path, obj) -> None:
+    write_bytes_atomic(path, json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def write_shards(shards_dir: Path, manifest: dict, shards: dict) -> None:
+    shards_dir.mkdir(parents=True, exist_ok=True)
+    for name, shard in shards.items():
+        write_json_atomic(shards_dir / name, shard)
+    # The manifest goes last so readers never see it point at shards that aren't written yet
+    write_json_atomic(shards_dir / content_store.MANIFEST_NAME, manifest)
+
+    for stale in shards_dir.glob("*.json"):
+        if stale.name != content_store.MANIFEST_NAME and stale.name not in shards:
+            stale.unlink()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Clean and validate data/content.json once and write the render-ready artifacts app.py loads."
+    )
+    parser.add_argument("--source", type=Path, default=content_store.DATA_PATH)
+    parser.add_argument("--out", type=Path, help="single-file artifact (default: <source>.compiled.json)")
+    parser.add_argument("--shards-dir", type=Path, help="per-specialism shards + manifest (default: shards/ next to source)")
+    parser.add_argument(
+        "--indexed",
+        action="store_true",
+        help="also write the mmap'd random-access file (<source>.idx) for very large catalogues",
+    )
+    parser.add_argument(
+        "--bundle",
+        action="store_true",
+        help="also write the compressed source bundle (<source>.wbz), which can be shipped instead of content.json",
+    )
+    parser.add_argument("--check", action="store_true", help="validate only, do not write artifacts")
+    args = parser.parse_args()
+
+    if not args.source.exists():
+        raise SystemExit(f"Missing: {args.source.resolve()}")
+
+    raw = args.source.read_bytes()
+    try:
+        content = json.loads(raw.decode("utf-8"))
+    except ValueError as e:
+        raise SystemExit(f"{args.source} is not valid JSON: {e}")
+
+    problems = content_store.validate_content(content)
+    if problems:
+        print(f"❌ {len(problems)} schema problem(s) in {args.source}:")
+        for problem in problems:
+            print(f" - {problem}")
+        raise SystemExit(1)
+
+    years = sum(len(payload["years"]) for payload in content.values())
+    if args.check:
+        print(f"✅ {args.source} is valid ({len(content)} specialisms, {years} years).")
+        return
+
+    source_stat = content_store.stat_key(args.source)
+    out = args.out or content_store.compiled_path_for(args.source)
+    shards_dir = args.shards_dir or content_store.shards_dir_for(args.source)
+
+    write_json_atomic(out, content_store.build_compiled_artifact(raw, source_stat))
+    manifest, shards = content_store.build_shards(raw, source_stat)
+    write_shards(shards_dir, manifest, shards)
+
+    print(f"✅ Compiled {len(content)} specialisms across {years} years into {out}")
+    print(f"   and {len(shards)} shards + {content_store.MANIFEST_NAME} in {shards_dir}.")
+
+    if args.indexed:
+        indexed_path = content_store.indexed_path_for(args.source)
+        write_bytes_atomic(indexed_path, content_store.build_indexed_artifact(raw, source_stat))
+        print(f"✅ Wrote indexed content to {indexed_path}.")
+
+    if args.bundle:
+        bundle_path = content_store.bundle_path_for(args.source)
+        bundle = content_store.build_bundle_artifact(raw, source_stat)
+        write_bytes_atomic(bundle_path, bundle)
+        print(f"✅ Wrote {bundle_path} ({len(bundle):,} bytes, {len(raw) / len(bundle):.1f}x smaller than {args.source.name}).")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import json
+import re
+import struct
+import zlib
+from collections import Counter
+from pathlib import Path
+
+# -------------------------------
+# Compressed content bundle (optional, built with compile_content.py --bundle)
+#
+# Layout: MAGIC | u64 meta length | u32 dictionary length | meta JSON | dictionary | members
+# The source content (not cleaned, so it can stand in for content.json) is stored
+# as one zlib member per specialism, each compressed against the same preset
+# dictionary. The dictionary is trained from the sentence fragments several
+# specialisms repeat, so every member can refer to them; zlib's window is 32 KiB,
+# which one specialism fits, while a single stream would only see the dictionary
+# at its start. Members are read, inflated and parsed one at a time.
+# -------------------------------
+MAGIC = b"WBZIP1\n\0"
+HEADER = struct.Struct("<8sQI")
+DICTIONARY_SIZE = 32 * 1024  # zlib cannot use a longer preset dictionary
+LEVEL = 9
+CHUNK_SIZE = 1 << 16
+
+FRAGMENT_RE = re.compile(r"(?<=[.,;:!?])\s+")
+MIN_FRAGMENT = 12
+
+
+def _strings(obj):
+    if isinstance(obj, str):
+        yield obj
+    elif isinstance(obj, list):
+        for item in obj:
+            yield from _strings(item)
+    elif isinstance(obj, dict):
+        for item in obj.values():
+            yield from _strings(item)
+
+
+def train_dictionary(content: dict, size: int = DICTIONARY_SIZE) -> bytes:
+    # Sentence fragments found in at least two specialisms, most bytes saved first.
+    # zlib reaches the end of the dictionary with the shortest distances, so the
+    # most valuable fragments go last.
+    seen = Counter()
+    for payload in content.values():
+        seen.update({
+            fragment
+            for text in _strings(payload)
+            for fragment in FRAGMENT_RE.split(text)
+            if len(fragment) >= MIN_FRAGMENT
+        })
+
+    ranked = sorted(
+        ((count * len(fragment.encode("utf-8")), fragment) for fragment, count in seen.items() if count > 1),
+        reverse=True,
+    )
+    chosen, used = [], 0
+    for _, fragment in ranked:
+        data = fragment.encode("utf-8")
+        if used + len(data) + 1 <= size:
+            chosen.append(data)
+            used += len(data) + 1
+    return b" ".join(reversed(chosen))
+
+
+def build_bundle(content: dict, meta: dict) -> bytes:
+    zdict = train_dictionary(content)
+    members = []
+    for payload in content.values():
+        compressor = zlib.compressobj(LEVEL, zdict=zdict) if zdict else zlib.compressobj(LEVEL)
+        data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        members.append(compressor.compress(data) + compressor.flush())
+
+    index = [[niche, len(member)] for niche, member in zip(content, members)]
+    meta_json = json.dumps({**meta, "specialisms": index}, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return HEADER.pack(MAGIC, len(meta_json), len(zdict)) + meta_json + zdict + b"".join(members)
+
+
+def _read_exactly(f, size: int) -> bytes:
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError("truncated content bundle")
+    return data
+
+
+def read_meta(path: Path) -> dict:
+    # Only the header: enough to decide whether the bundle is current
+    with open(path, "rb") as f:
+        meta, _ = _read_header(f, path)
+    return meta
+
+
+def _read_header(f, path: Path) -> tuple:
+    magic, meta_length, dict_length = HEADER.unpack(_read_exactly(f, HEADER.size))
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a content bundle")
+    meta = json.loads(_read_exactly(f, meta_length).decode("utf-8"))
+    return meta, _read_exactly(f, dict_length)
+
+
+def iter_bundle(path: Path):
+    # Yields (specialism, source payload), inflating one member at a time in chunks
+    with open(path, "rb") as f:
+        meta, zdict = _read_header(f, path)
+        for niche, length in meta["specialisms"]:
+            decompressor = zlib.decompressobj(zdict=zdict) if zdict else zlib.decompressobj()
+            parts = []
+            while length:
+                chunk = _read_exactly(f, min(length, CHUNK_SIZE))
+                parts.append(decompressor.decompress(chunk))
+                length -= len(chunk)
+            parts.append(decompressor.flush())
+            if not decompressor.eof:
+                raise ValueError(f"corrupt content bundle member: {niche}")
+            yield niche, json.loads(b"".join(parts).decode("utf-8"))
+
+
+def read_bundle(path: Path) -> dict:
+    return dict(iter_bundle(path))
@@ -0,0 +1,100 @@
+from collections.abc import Mapping
+from types import MappingProxyType
+
+# -------------------------------
+# Immutable content model
+#
+# What the loaders build once per specialism and every session reads: a Specialism
+# holds its sorted year tuple and a read-only year -> YearPayload mapping, and a
+# YearPayload holds one tuple of cleaned paragraphs per section. Both use __slots__
+# and refuse assignment, so they are shared across sessions without copies.
+# YearPayload is also a read-only Mapping (payload["investment"]), always holding
+# every section, so callers never need `.get(key, []) or []`.
+# -------------------------------
+YEAR_KEYS = ("market_shift", "technical_shift", "talent_shift", "investment", "conclusion")
+
+
+def year_sort_key(year: str) -> int:
+    return int(year) if year.isdigit() else 9999
+
+
+def _frozen(self, name, value):
+    raise AttributeError(f"{type(self).__name__} is immutable")
+
+
+class YearPayload(Mapping):
+    __slots__ = YEAR_KEYS
+
+    def __init__(self, market_shift=(), technical_shift=(), talent_shift=(), investment=(), conclusion=()) -> None:
+        set_ = object.__setattr__
+        set_(self, "market_shift", market_shift)
+        set_(self, "technical_shift", technical_shift)
+        set_(self, "talent_shift", talent_shift)
+        set_(self, "investment", investment)
+        set_(self, "conclusion", conclusion)
+
+    __setattr__ = _frozen
+    __delattr__ = _frozen
+
+    @classmethod
+    def from_sections(cls, sections: dict, freeze=tuple) -> "YearPayload":
+        # sections: key -> list of paragraphs; unknown keys are dropped
+        return cls(**{key: freeze(sections[key]) for key in YEAR_KEYS if sections.get(key)})
+
+    def __getitem__(self, key: str) -> tuple:
+        if key not in YEAR_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(YEAR_KEYS)
+
+    def __len__(self) -> int:
+        return len(YEAR_KEYS)
+
+    def __repr__(self) -> str:
+        counts = ", ".join(f"{key}={len(getattr(self, key))}" for key in YEAR_KEYS)
+        return f"YearPayload({counts})"
+
+
+EMPTY_YEAR = YearPayload()
+
+
+class Specialism:
+    __slots__ = ("name", "year_list", "years")
+
+    def __init__(self, name: str, year_list: tuple, years: Mapping) -> None:
+        set_ = object.__setattr__
+        set_(self, "name", name)
+        set_(self, "year_list", year_list)  # sorted
+        set_(self, "years", years)  # year -> YearPayload, read-only
+
+    __setattr__ = _frozen
+    __delattr__ = _frozen
+
+    @classmethod
+    def from_resolved(cls, name: str, payload: dict, memo: dict = None) -> "Specialism":
+        # From resolve_content()/expand_compiled() output. Sections the loader already
+        # shares (e.g. one conclusion list used by every year) become one shared tuple.
+        memo = {} if memo is None else memo
+
+        def freeze(blocks) -> tuple:
+            frozen = memo.get(id(blocks))
+            if frozen is None:
+                frozen = memo[id(blocks)] = (blocks, tuple(blocks))
+            return frozen[1]
+
+        years = {
+            year: YearPayload.from_sections(year_payload or {}, freeze)
+            for year, year_payload in (payload.get("years") or {}).items()
+        }
+        return cls(name, tuple(sorted(years, key=year_sort_key)), MappingProxyType(years))
+
+    def year(self, year: str) -> YearPayload:
+        return self.years.get(year, EMPTY_YEAR)
+
+    def __repr__(self) -> str:
+        return f"Specialism({self.name!r}, years={len(self.year_list)})"
+
+
+EMPTY_SPECIALISM = Specialism("", (), MappingProxyType({}))
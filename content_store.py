@@ -0,0 +1,682 @@
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+import zlib
+from pathlib import Path
+
+from content_bundle import build_bundle, read_bundle, read_meta
+from content_model import EMPTY_SPECIALISM, YEAR_KEYS, Specialism, YearPayload, year_sort_key
+from indexed_content import IndexedContent, build_indexed
+from normaliser import clean_text, walk
+
+BASE_DIR = Path(__file__).parent
+DATA_PATH = BASE_DIR / "data" / "content.json"
+MANIFEST_NAME = "manifest.json"
+
+
+def compiled_path_for(path: Path) -> Path:
+    return path.with_name(f"{path.stem}.compiled.json")
+
+
+def shards_dir_for(path: Path) -> Path:
+    return path.parent / "shards"
+
+
+def indexed_path_for(path: Path) -> Path:
+    return path.with_name(f"{path.stem}.idx")
+
+
+def bundle_path_for(path: Path) -> Path:
+    return path.with_name(f"{path.stem}.wbz")
+
+
+COMPILED_PATH = compiled_path_for(DATA_PATH)
+SHARDS_DIR = shards_dir_for(DATA_PATH)
+INDEXED_PATH = indexed_path_for(DATA_PATH)
+BUNDLE_PATH = bundle_path_for(DATA_PATH)
+
+# Bump whenever clean_text output changes so stale compiled artifacts are ignored.
+CLEANER_VERSION = 1
+COMPILED_FORMAT = "wayback-compiled/2"
+SHARD_FORMAT = "wayback-shard/1"
+MANIFEST_FORMAT = "wayback-manifest/1"
+INDEXED_FORMAT = "wayback-indexed/1"
+BUNDLE_FORMAT = "wayback-bundle/1"
+
+LOGGER = logging.getLogger("wayback.content")
+
+# -------------------------------
+# Schema
+# A specialism may carry one "conclusion" that every year without its own inherits,
+# so apply_master_conclusions.py no longer copies it into each year.
+# -------------------------------
+def _check_paragraphs(problems: list, where: str, key: str, blocks) -> None:
+    if not isinstance(blocks, list):
+        problems.append(f"{where}: '{key}' must be a list of paragraphs")
+    elif not all(isinstance(p, str) for p in blocks):
+        problems.append(f"{where}: '{key}' must only contain strings")
+
+
+def validate_content(content) -> list:
+    problems = []
+    if not isinstance(content, dict):
+        return ["top level must be an object of specialisms"]
+
+    for niche, payload in content.items():
+        years = (payload or {}).get("years") if isinstance(payload, dict) else None
+        if not isinstance(years, dict):
+            problems.append(f"{niche}: missing 'years' object")
+            continue
+
+        shared_conclusion = "conclusion" in payload
+        if shared_conclusion:
+            _check_paragraphs(problems, niche, "conclusion", payload["conclusion"])
+        for key in payload.keys() - {"years", "conclusion"}:
+            problems.append(f"{niche}: unknown key '{key}'")
+
+        for year, year_payload in years.items():
+            where = f"{niche} / {year}"
+            if not year.isdigit():
+                problems.append(f"{where}: year key must be numeric")
+            if not isinstance(year_payload, dict):
+                problems.append(f"{where}: year payload must be an object")
+                continue
+
+            for key in YEAR_KEYS:
+                if key == "conclusion" and key not in year_payload and shared_conclusion:
+                    continue
+                _check_paragraphs(problems, where, key, year_payload.get(key))
+
+            for key in year_payload.keys() - set(YEAR_KEYS):
+                problems.append(f"{where}: unknown section '{key}'")
+
+    return problems
+
+
+def resolve_content(content: dict, clean=clean_text) -> dict:
+    # Clean each distinct paragraph once, intern identical paragraphs and sections so
+    # they are shared in memory, and give years without a conclusion the specialism's.
+    cleaned = {}
+    strings = {}
+    sections = {}
+
+    def section(blocks):
+        if not isinstance(blocks, list) or not all(isinstance(p, str) for p in blocks):
+            return walk(blocks) if clean else blocks
+        out = []
+        for p in blocks:
+            c = cleaned.get(p)
+            if c is None:
+                c = clean(p) if clean else p
+                c = cleaned[p] = strings.setdefault(c, c)
+            out.append(c)
+        return sections.setdefault(tuple(out), out)
+
+    resolved = {}
+    for niche, payload in content.items():
+        payload = payload or {}
+        conclusion = section(payload["conclusion"]) if "conclusion" in payload else None
+
+        years = {}
+        for year, year_payload in (payload.get("years") or {}).items():
+            year_payload = {key: section(blocks) for key, blocks in (year_payload or {}).items()}
+            if conclusion is not None:
+                year_payload.setdefault("conclusion", conclusion)
+            years[year] = year_payload
+
+        resolved[niche] = {"years": years}
+        if conclusion is not None:
+            resolved[niche]["conclusion"] = conclusion
+    return resolved
+
+# -------------------------------
+# Compiled artifact (see compile_content.py)
+# Cleaned paragraphs are stored once in a string table and referenced by index;
+# a conclusion shared by every year is stored once per specialism.
+# -------------------------------
+def _compile(content: dict) -> dict:
+    strings = []
+    index = {}
+
+    def refs(blocks: list) -> list:
+        out = []
+        for p in blocks:
+            i = index.get(p)
+            if i is None:
+                i = index[p] = len(strings)
+                strings.append(p)
+            out.append(i)
+        return out
+
+    specialisms = {}
+    for niche, payload in content.items():
+        years = payload["years"]
+        shared = payload.get("conclusion")
+        if shared is None:
+            # Sections are interned, so identity means every year has the same conclusion
+            conclusions = [y.get("conclusion") for y in years.values()]
+            if conclusions and conclusions[0] is not None and all(c is conclusions[0] for c in conclusions):
+                shared = conclusions[0]
+
+        entry = specialisms[niche] = {}
+        if shared is not None:
+            entry["conclusion"] = refs(shared)
+        entry["years"] = {
+            year: {
+                key: refs(blocks)
+                for key, blocks in year_payload.items()
+                if not (key == "conclusion" and blocks is shared)
+            }
+            for year, year_payload in years.items()
+        }
+
+    return {"strings": strings, "specialisms": specialisms}
+
+
+def specialism_hash(payload) -> str:
+    # Identifies one specialism's cleaned content: its source JSON plus the cleaner version
+    data = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(f"{CLEANER_VERSION}\n{data}".encode("utf-8")).hexdigest()[:16]
+
+
+def _source_meta(raw: bytes, source_stat, source_content: dict) -> dict:
+    return {
+        "cleaner_version": CLEANER_VERSION,
+        "source_sha256": hashlib.sha256(raw).hexdigest(),
+        # Lets the loader trust the artifact from a stat() alone, without reading the source
+        "source_stat": list(source_stat) if source_stat else None,
+        "specialism_sha256": {niche: specialism_hash(payload) for niche, payload in source_content.items()},
+    }
+
+
+def build_compiled_artifact(raw: bytes, source_stat=None) -> dict:
+    source_content = json.loads(raw.decode("utf-8"))
+    content = resolve_content(source_content)
+    return {"format": COMPILED_FORMAT, **_source_meta(raw, source_stat, source_content), **_compile(content)}
+
+
+def build_indexed_artifact(raw: bytes, source_stat=None) -> bytes:
+    source_content = json.loads(raw.decode("utf-8"))
+    content = resolve_content(source_content)
+    return build_indexed(content, {"format": INDEXED_FORMAT, **_source_meta(raw, source_stat, source_content)})
+
+
+def build_bundle_artifact(raw: bytes, source_stat=None) -> bytes:
+    # The source content, compressed; it can be shipped instead of content.json
+    source_content = json.loads(raw.decode("utf-8"))
+    return build_bundle(source_content, {"format": BUNDLE_FORMAT, **_source_meta(raw, source_stat, source_content)})
+
+
+def niche_slug(niche: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", niche.lower()).strip("-") or "specialism"
+
+
+def shard_file_name(niche: str, taken) -> str:
+    slug = niche_slug(niche)
+    name, n = f"{slug}.json", 2
+    while name in taken or name == MANIFEST_NAME:
+        name, n = f"{slug}-{n}.json", n + 1
+    return name
+
+
+def build_shards(raw: bytes, source_stat=None) -> tuple:
+    # One compiled artifact per specialism plus a small manifest of niches and years,
+    # so the app can start from the manifest and load a shard on first use.
+    source_content = json.loads(raw.decode("utf-8"))
+    content = resolve_content(source_content)
+    meta = _source_meta(raw, source_stat, source_content)
+
+    manifest = {"format": MANIFEST_FORMAT, **meta, "specialisms": {}}
+    shards = {}
+    for niche, payload in content.items():
+        name = shard_file_name(niche, shards)
+        shards[name] = {
+            "format": SHARD_FORMAT,
+            "source_sha256": meta["source_sha256"],
+            **_compile({niche: payload}),
+        }
+        manifest["specialisms"][niche] = {
+            "file": name,
+            "years": sorted(payload["years"], key=year_sort_key),
+        }
+    return manifest, shards
+
+
+def expand_compiled(artifact: dict) -> dict:
+    # Builds the same shape as resolve_content(); identical sections share one list.
+    strings = artifact["strings"]
+    sections = {}
+
+    def texts(refs: list) -> list:
+        key = tuple(refs)
+        out = sections.get(key)
+        if out is None:
+            out = sections[key] = [strings[i] for i in refs]
+        return out
+
+    content = {}
+    for niche, entry in artifact["specialisms"].items():
+        conclusion = texts(entry["conclusion"]) if "conclusion" in entry else None
+
+        years = {}
+        for year, year_refs in entry["years"].items():
+            year_payload = {key: texts(refs) for key, refs in year_refs.items()}
+            if conclusion is not None:
+                year_payload.setdefault("conclusion", conclusion)
+            years[year] = year_payload
+
+        content[niche] = {"years": years}
+        if conclusion is not None:
+            content[niche]["conclusion"] = conclusion
+    return content
+
+
+# -------------------------------
+# Process-wide content store
+# -------------------------------
+class ContentStore:
+    """Cleaned content, parsed once per process and shared read-only by every session.
+
+    Only the niche -> years index is needed up front; each specialism is loaded on
+    first use through load_specialism, frozen into a content_model.Specialism and
+    then kept for the process. Sessions get the shared objects, never copies.
+    niche_versions (specialism_hash per niche) let caches keyed by niche survive a
+    reload that did not touch that niche.
+    """
+
+    def __init__(
+        self, version: str, years_by_niche: dict, load_specialism, niche_versions: dict = None, lazy: bool = False
+    ) -> None:
+        self.version = version
+        # Specialisms are read from disk on first access (shards): nothing should load
+        # them ahead of a visitor
+        self.lazy = lazy
+        self.niches = tuple(sorted(years_by_niche))
+        self._years = {
+            niche: tuple(sorted(years, key=year_sort_key)) for niche, years in years_by_niche.items()
+        }
+        self._load_specialism = load_specialism
+        self._niche_versions = niche_versions or {}
+        self._specialisms = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_content(cls, content: dict, version: str, niche_versions: dict = None) -> "ContentStore":
+        # Sections shared across specialisms (interned by the loader) stay shared, and
+        # the store keeps only the frozen model, not the dicts it was built from
+        memo = {}
+        specialisms = {niche: as_specialism(niche, payload, memo) for niche, payload in content.items()}
+        store = cls(
+            version,
+            {niche: specialism.year_list for niche, specialism in specialisms.items()},
+            specialisms.__getitem__,
+            niche_versions,
+        )
+        store._specialisms = dict(specialisms)
+        return store
+
+    def niche_version(self, niche: str) -> str:
+        # Changes whenever this niche's content does; the whole store's version otherwise
+        return self._niche_versions.get(niche) or self.version
+
+    def loaded_specialism(self, niche: str, niche_version: str):
+        # The already cleaned specialism, if it was built from the same source content
+        if niche_version and self._niche_versions.get(niche) == niche_version:
+            return self._specialisms.get(niche)
+        return None
+
+    def adopt(self, previous: "ContentStore") -> None:
+        # Take over specialisms the previous store already loaded and that did not change
+        for niche, niche_version in self._niche_versions.items():
+            if niche not in self._specialisms:
+                specialism = previous.loaded_specialism(niche, niche_version)
+                if specialism is not None:
+                    self._specialisms[niche] = specialism
+
+    def available_years_for(self, niche: str) -> tuple:
+        return self._years.get(niche, ())
+
+    def is_loaded(self, niche: str) -> bool:
+        return niche in self._specialisms
+
+    def get_specialism(self, niche: str) -> Specialism:
+        specialism = self._specialisms.get(niche)
+        if specialism is None and niche in self._years:
+            with self._lock:
+                specialism = self._specialisms.get(niche)
+                if specialism is None:
+                    specialism = self._specialisms[niche] = as_specialism(niche, self._load_specialism(niche))
+        return specialism or EMPTY_SPECIALISM
+
+    def get_year_payload(self, niche: str, year: str) -> YearPayload:
+        return self.get_specialism(niche).year(year)
+
+
+def as_specialism(niche: str, payload, memo: dict = None) -> Specialism:
+    # Loaders return either a Specialism (indexed content) or resolve_content()'s dicts
+    if isinstance(payload, Specialism):
+        return payload
+    return Specialism.from_resolved(niche, payload or {}, memo)
+
+
+class _Source:
+    # content.json as seen by one (re)open: bytes and hash are only read if needed.
+    def __init__(self, path: Path, key: tuple) -> None:
+        self.path = path
+        self.key = key
+        self._raw = None
+        self._sha256 = None
+
+    @property
+    def raw(self) -> bytes:
+        if self._raw is None:
+            self._raw = self.path.read_bytes()
+        return self._raw
+
+    @property
+    def sha256(self) -> str:
+        if self._sha256 is None:
+            self._sha256 = hashlib.sha256(self.raw).hexdigest()
+        return self._sha256
+
+    def content(self) -> dict:
+        return json.loads(self.raw.decode("utf-8"))
+
+    def built_from(self, artifact: dict) -> bool:
+        # Only trust an artifact built from these exact source bytes by this cleaner.
+        if artifact.get("cleaner_version") != CLEANER_VERSION:
+            return False
+        if artifact.get("source_stat") == list(self.key):
+            return True
+        return artifact.get("source_sha256") == self.sha256
+
+
+class _BundleSource(_Source):
+    # content.json as stored in its compressed bundle (see content_bundle.py): the
+    # hash comes from the bundle header and the content is inflated as a stream.
+    # A truncated or corrupt bundle falls back to `fallback` (content.json) if given.
+    def __init__(self, path: Path, key: tuple, meta: dict, fallback: Path = None) -> None:
+        super().__init__(path, key)
+        self.meta = meta
+        self.fallback = fallback
+        self._sha256 = meta["source_sha256"]
+
+    def content(self) -> dict:
+        try:
+            return read_bundle(self.path)
+        except (OSError, ValueError, zlib.error) as e:
+            if self.fallback is None:
+                raise
+            LOGGER.warning("⚠️ %s is unreadable, reading %s instead: %s", self.path.name, self.fallback.name, e)
+        source = _Source(self.fallback, self.key)
+        content = source.content()
+        self._sha256 = source.sha256
+        return content
+
+
+def _bundle_meta(bundle_path: Path):
+    try:
+        meta = read_meta(bundle_path)
+    except (OSError, ValueError):
+        return None
+    return meta if meta.get("format") == BUNDLE_FORMAT else None
+
+
+def source_path(path: Path) -> Path:
+    # content.json, or its compressed bundle when only the bundle was shipped
+    bundle_path = bundle_path_for(path)
+    return bundle_path if not path.exists() and bundle_path.exists() else path
+
+
+def source_exists(path: Path) -> bool:
+    return path.exists() or bundle_path_for(path).exists()
+
+
+def _open_source(path: Path, key: tuple) -> _Source:
+    bundle_path = bundle_path_for(path)
+    meta = _bundle_meta(bundle_path) if bundle_path.exists() else None
+    if path.exists():
+        # A bundle compiled from this very file is read instead: far fewer bytes
+        if meta and meta.get("source_stat") == list(key):
+            return _BundleSource(bundle_path, key, meta, fallback=path)
+        return _Source(path, key)
+    if meta is None:
+        raise ValueError(f"{bundle_path.name} is not a valid content bundle")
+    return _BundleSource(bundle_path, key, meta)
+
+
+def _read_json(path: Path):
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _open_sharded(shards_dir: Path, source: _Source):
+    manifest = _read_json(shards_dir / MANIFEST_NAME)
+    if not manifest or manifest.get("format") != MANIFEST_FORMAT or not source.built_from(manifest):
+        return None
+
+    source_sha256 = manifest["source_sha256"]
+    entries = manifest["specialisms"]
+
+    def load_specialism(niche: str) -> dict:
+        shard = _read_json(shards_dir / entries[niche]["file"])
+        if shard and shard.get("format") == SHARD_FORMAT and shard.get("source_sha256") == source_sha256:
+            return expand_compiled(shard)[niche]
+        # Shard missing or from a different build: clean this niche from the source
+        return resolve_content({niche: source.content()[niche]})[niche]
+
+    return ContentStore(
+        source_sha256[:16],
+        {niche: entry["years"] for niche, entry in entries.items()},
+        load_specialism,
+        manifest.get("specialism_sha256"),
+        lazy=True,
+    )
+
+
+def _open_indexed(indexed_path: Path, source: _Source):
+    if not indexed_path.exists():
+        return None
+    try:
+        indexed = IndexedContent(indexed_path)
+    except (OSError, ValueError):
+        return None
+    if indexed.meta.get("format") != INDEXED_FORMAT or not source.built_from(indexed.meta):
+        return None
+    return ContentStore(
+        indexed.meta["source_sha256"][:16],
+        indexed.years_by_niche,
+        indexed.load_specialism,
+        indexed.meta.get("specialism_sha256"),
+    )
+
+
+def _open_compiled(compiled_path: Path, source: _Source):
+    artifact = _read_json(compiled_path)
+    if not artifact or artifact.get("format") != COMPILED_FORMAT or not source.built_from(artifact):
+        return None
+    return ContentStore.from_content(
+        expand_compiled(artifact), artifact["source_sha256"][:16], artifact.get("specialism_sha256")
+    )
+
+
+def _open_raw(source: _Source, previous: ContentStore = None) -> ContentStore:
+    # Only specialisms whose source changed since `previous` are cleaned again
+    source_content = source.content()
+    hashes = {niche: specialism_hash(payload) for niche, payload in source_content.items()}
+
+    reused = {}
+    if previous is not None:
+        for niche, niche_version in hashes.items():
+            specialism = previous.loaded_specialism(niche, niche_version)
+            if specialism is not None:
+                reused[niche] = specialism
+
+    cleaned = resolve_content({niche: p for niche, p in source_content.items() if niche not in reused})
+    content = {niche: reused.get(niche) or cleaned[niche] for niche in source_content}
+    return ContentStore.from_content(content, source.sha256[:16], hashes)
+
+
+def changed_niches(previous: ContentStore, store: ContentStore) -> set:
+    # Niches added, removed or edited between two stores
+    niches = set(previous.niches) | set(store.niches)
+    return {niche for niche in niches if previous.niche_version(niche) != store.niche_version(niche)}
+
+
+_lock = threading.Lock()
+_stores = {}  # path -> (stat key, ContentStore)
+_failed = {}  # path -> stat key that last failed to open (None while the file is missing)
+_listeners = []  # callback(previous store, new store, changed niches)
+
+
+def on_reload(callback) -> None:
+    # Called after content.json changed and a new store replaced the previous one
+    if callback not in _listeners:
+        _listeners.append(callback)
+
+
+class PerVersionCache:
+    # One object derived from the whole store (search index, trend matrix), built as
+    # build(store, previous) so the parts of unchanged niches can be reused. Only the
+    # current content version is kept; once in use, a reload rebuilds it right away.
+    def __init__(self, build) -> None:
+        self._build = build
+        self._lock = threading.Lock()
+        self._items = {}  # content version -> built object
+        on_reload(self._on_reload)
+
+    def get(self, store: ContentStore):
+        item = self._items.get(store.version)
+        if item is None:
+            with self._lock:
+                item = self._items.get(store.version)
+                if item is None:
+                    previous = next(iter(self._items.values()), None)
+                    item = self._build(store, previous)
+                    self._items = {store.version: item}
+        return item
+
+    def _on_reload(self, previous, store, changed) -> None:
+        if self._items:
+            self.get(store)
+
+
+def stat_key(path: Path) -> tuple:
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def get_store(path: Path = DATA_PATH) -> ContentStore:
+    # Cheap stat check on every call; content is only re-opened when content.json
+    # changed on disk. Fresh build artifacts from compile_content.py are preferred:
+    # the optional mmap'd index (years decoded on demand), shards (manifest only,
+    # specialisms on demand), the single compiled file, and finally parsing +
+    # cleaning content.json itself, read from its compressed bundle (--bundle) when
+    # that was built from this file or shipped in its place.
+    cached = _stores.get(path)
+    try:
+        key = stat_key(source_path(path))
+    except OSError as e:
+        # Gone for a moment mid-publish (deleted, then written): keep the last good store
+        if cached is None:
+            raise
+        if _failed.get(path, False) is not None:
+            _failed[path] = None
+            LOGGER.warning("⚠️ %s is missing, keeping the previous content: %s", path.name, e)
+        return cached[1]
+    if cached and cached[0] == key:
+        return cached[1]
+
+    with _lock:
+        cached = _stores.get(path)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        previous = cached[1] if cached else None
+        if previous and _failed.get(path) == key:
+            return previous
+        try:
+            source = _open_source(path, key)
+            if previous and previous.version == source.sha256[:16]:
+                store = previous
+            else:
+                store = (
+                    _open_indexed(indexed_path_for(path), source)
+                    or _open_sharded(shards_dir_for(path), source)
+                    or _open_compiled(compiled_path_for(path), source)
+                    or _open_raw(source, previous)
+                )
+                if previous:
+                    store.adopt(previous)
+        except Exception as e:
+            if previous is None:
+                raise
+            # A half-edited or invalid file: keep serving the last good store and
+            # try again once the file changes on disk
+            _failed[path] = key
+            LOGGER.warning("⚠️ Could not reload %s, keeping the previous content: %s", path.name, e)
+            return previous
+        _failed.pop(path, None)
+        _stores[path] = (key, store)
+
+    if previous and store is not previous:
+        changed = changed_niches(previous, store)
+        for callback in list(_listeners):
+            try:
+                callback(previous, store, changed)
+            except Exception as e:
+                LOGGER.warning("⚠️ Content reload hook %s failed: %s", getattr(callback, "__name__", callback), e)
+    return store
+
+
+def loaded_store(path: Path = DATA_PATH):
+    # The store get_store() would return without re-opening anything, or None when it
+    # has work to do: lets async callers keep reloads off their event loop
+    cached = _stores.get(path)
+    try:
+        return cached[1] if cached and cached[0] == stat_key(source_path(path)) else None
+    except OSError:
+        return None
+
+
+class ContentWatcher(threading.Thread):
+    # Polls content.json so a publish is picked up (and reload hooks run) before the
+    # next session asks for it; get_store() itself still stat-checks on every call.
+    def __init__(self, path: Path, interval: float) -> None:
+        super().__init__(name=f"content-watcher:{path.name}", daemon=True)
+        self.path = path
+        self.interval = interval
+
+    def run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            try:
+                get_store(self.path)
+            except Exception as e:
+                # Nothing loaded yet (get_store() keeps the last good store otherwise)
+                LOGGER.warning("⚠️ Content watcher could not load %s: %s", self.path.name, e)
+
+
+_watchers = {}  # path -> ContentWatcher
+
+
+def start_watcher(path: Path = DATA_PATH, interval: float = 2.0) -> ContentWatcher:
+    with _lock:
+        watcher = _watchers.get(path)
+        if watcher is None:
+            watcher = _watchers[path] = ContentWatcher(path, interval)
+            watcher.start()
+    return watcher
+
+
+def available_years_for(niche: str) -> tuple:
+    return get_store().available_years_for(niche)
+
+
+def get_year_payload(niche: str, year: str) -> YearPayload:
+    return get_store().get_year_payload(niche, year)
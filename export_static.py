@@ -0,0 +1,249 @@
+import argparse
+import html
+import json
+from pathlib import Path
+
+import background
+import content_store
+import render
+from compile_content import write_bytes_atomic
+
+# -------------------------------
+# Static export: every specialism x year as a plain HTML page
+#
+# Same cleaned content, section order, glass cards, footer and tools hub as app.py,
+# pre-rendered so read-only browsing can be served by any file server or CDN.
+# Layout: index.html, site.css, tools.html, static/ (background) and
+# <specialism>/<year>.html. Each page carries a specialism picker and a small
+# slider that moves between the year pages; prev/next links work without JS.
+# -------------------------------
+BASE_DIR = Path(__file__).parent
+OUT_DIR = BASE_DIR / "site"
+BG_PATH = BASE_DIR / "assets" / "bg1.jpg"
+MANIFEST_NAME = "export-manifest.json"
+
+TITLE = "The Hamilton Barnes Specialism Wayback Machine"
+CURRENT_TOOL = "Wayback Machine"
+
+PAGE_CSS = """body {
+    margin: 0;
+    font-family: "Source Sans Pro", sans-serif;
+    color: #000000;
+    background-color: #ffffff;
+}
+
+.container {
+    max-width: 900px;
+    margin: 0 auto;
+    padding: 3rem 1rem 5rem 1rem;
+}
+
+h2, h3 {
+    margin-top: 1.4rem;
+}
+
+hr {
+    border: none;
+    border-top: 1px solid rgba(49, 51, 63, 0.2);
+    margin: 2rem 0;
+}
+
+a {
+    color: #000000;
+}
+
+.site-nav {
+    display: flex;
+    gap: 1rem;
+    align-items: center;
+    flex-wrap: wrap;
+    font-size: 0.9rem;
+}
+
+.year-slider {
+    width: 100%;
+    accent-color: #7ac043;
+}
+
+.year-ticks, .year-links {
+    display: flex;
+    justify-content: space-between;
+    font-size: 0.8rem;
+}
+
+.niche-list li {
+    margin-bottom: 0.4rem;
+}
+
+.tools-hub {
+    width: 100%;
+    height: 1100px;
+    border: none;
+}
+"""
+
+
+def site_css(static_names: list) -> str:
+    if len(static_names) > 1:
+        bg = background.variant_rules(BG_PATH, "static/", selector="body")
+    elif static_names:
+        bg = f'body {{ background: url("static/{static_names[0]}") center / cover fixed; }}'
+    else:
+        bg = ""
+    return PAGE_CSS + "\n" + render.GLASS_CARD_CSS + bg + "\n"
+
+
+def page(title: str, body: str, depth: int, head: str = "") -> str:
+    root = "../" * depth
+    return f"""<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(title)}</title>
+<link rel="stylesheet" href="{root}site.css">
+{head}</head>
+<body>
+<main class="container">
+{body}
+</main>
+</body>
+</html>
+"""
+
+
+def footer_html(depth: int) -> str:
+    buttons = "".join(render.footer_button_html(label, url) for label, url in render.FOOTER_LINKS)
+    return (
+        f"<hr>{render.FOOTER_HEADING}{buttons}"
+        f'<iframe class="tools-hub" src="{"../" * depth}tools.html" title="Explore More Interactive Tools"></iframe>'
+    )
+
+
+def niche_picker(store, slugs: dict, current: str = None) -> str:
+    options = "".join(
+        f'<option value="../{slugs[niche]}/{store.available_years_for(niche)[0]}.html"'
+        f'{" selected" if niche == current else ""}>{html.escape(niche)}</option>'
+        for niche in store.niches if store.available_years_for(niche)
+    )
+    return (
+        '<nav class="site-nav"><a href="../index.html">All specialisms</a>'
+        '<label>Choose a Specialism <select onchange="location.href = this.value">'
+        f"{options}</select></label></nav>"
+    )
+
+
+def year_page(store, slugs: dict, niche: str, year: str) -> str:
+    years = store.available_years_for(niche)
+    i = years.index(year)
+    prev_year = years[i - 1] if i else None
+    next_year = years[i + 1] if i + 1 < len(years) else None
+    prev_link = f'<a rel="prev" href="{prev_year}.html">← {prev_year}</a>' if prev_year else "<span></span>"
+    next_link = f'<a rel="next" href="{next_year}.html">{next_year} →</a>' if next_year else "<span></span>"
+    # Neighbouring years are fetched in the background so the slider feels instant
+    prefetch = "".join(f'<link rel="prefetch" href="{y}.html">\n' for y in (prev_year, next_year) if y)
+
+    body = f"""{niche_picker(store, slugs, niche)}
+<h1>{TITLE}</h1>
+<label for="year-slider">Range Slider</label>
+<input class="year-slider" id="year-slider" type="range" min="0" max="{len(years) - 1}" step="1" value="{i}">
+<div class="year-ticks"><span>{years[0]}</span><span>{years[-1]}</span></div>
+<div class="year-links">{prev_link}{next_link}</div>
+<h2>{html.escape(niche)}: {year}</h2>
+{render.year_body_html(store.get_year_payload(niche, year))}
+{footer_html(1)}
+<script>
+const years = {json.dumps(years)};
+document.getElementById("year-slider").addEventListener("change", (e) => {{
+    location.href = years[e.target.value] + ".html";
+}});
+</script>"""
+    return page(f"{niche}: {year} · {TITLE}", body, depth=1, head=prefetch)
+
+
+def index_page(store, slugs: dict) -> str:
+    items = "".join(
+        f'<li><a href="{slugs[niche]}/{years[0]}.html">{html.escape(niche)}</a> ({years[0]}–{years[-1]})</li>'
+        for niche in store.niches
+        for years in [store.available_years_for(niche)] if years
+    )
+    body = f"""<h1>{TITLE}</h1>
+<h2>We heard that 2026 is the new 2016 👀</h2>
+<p>Here is how our tech specialisms fared over the past decade and what it means for the people building them.</p>
+<hr>
+<h3>Choose a Specialism</h3>
+<ul class="niche-list">{items}</ul>
+{footer_html(0)}"""
+    return page(TITLE, body, depth=0)
+
+
+def export(store, out_dir: Path) -> list:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+
+    def write(relative: str, text) -> None:
+        path = out_dir / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_bytes_atomic(path, text if isinstance(text, bytes) else text.encode("utf-8"))
+        written.append(relative)
+
+    # Background: the viewport-sized variants from build_assets.py when present
+    static_names = []
+    if BG_PATH.exists():
+        names = [background.variant_name(BG_PATH)] + [background.variant_name(BG_PATH, w) for w in background.VARIANT_WIDTHS]
+        if background.has_static_variants(BG_PATH):
+            static_names = names
+            for name in names:
+                write(f"static/{name}", (background.STATIC_DIR / name).read_bytes())
+        else:
+            static_names = [BG_PATH.name]
+            write(f"static/{BG_PATH.name}", BG_PATH.read_bytes())
+
+    write("site.css", site_css(static_names))
+    write("tools.html", render.tools_hub_html(CURRENT_TOOL))
+
+    slugs, taken = {}, set()
+    for niche in store.niches:
+        slug = base = content_store.niche_slug(niche)
+        n = 2
+        while slug in taken or slug == "static":
+            slug, n = f"{base}-{n}", n + 1
+        slugs[niche] = slug
+        taken.add(slug)
+
+    write("index.html", index_page(store, slugs))
+    for niche in store.niches:
+        for year in store.available_years_for(niche):
+            write(f"{slugs[niche]}/{year}.html", year_page(store, slugs, niche, year))
+
+    # Remove pages from a previous export that no longer exist (e.g. a renamed specialism)
+    manifest_path = out_dir / MANIFEST_NAME
+    previous = []
+    if manifest_path.exists():
+        previous = json.loads(manifest_path.read_text(encoding="utf-8")).get("files", [])
+    for relative in set(previous) - set(written):
+        stale = out_dir / relative
+        stale.unlink(missing_ok=True)
+        if stale.parent != out_dir and stale.parent.exists() and not any(stale.parent.iterdir()):
+            stale.parent.rmdir()
+    write_bytes_atomic(manifest_path, json.dumps({"version": store.version, "files": sorted(written)}, indent=2).encode("utf-8"))
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export every specialism x year page as static HTML.")
+    parser.add_argument("--source", type=Path, default=content_store.DATA_PATH)
+    parser.add_argument("--out", type=Path, default=OUT_DIR)
+    args = parser.parse_args()
+
+    if not content_store.source_exists(args.source):
+        raise SystemExit(f"❌ Missing {args.source}")
+
+    store = content_store.get_store(args.source)
+    written = export(store, args.out)
+    pages = sum(1 for relative in written if relative.endswith(".html") and "/" in relative)
+    print(f"✅ Exported {pages} pages across {len(store.niches)} specialisms to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
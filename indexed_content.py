@@ -0,0 +1,123 @@
+import json
+import mmap
+import struct
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+
+from content_model import Specialism, YearPayload, year_sort_key
+
+# -------------------------------
+# Indexed binary content (optional, built with compile_content.py --indexed)
+#
+# Layout: MAGIC | u64 index length | index JSON | payload
+# The index maps niche -> year -> section -> [offset, length] into the payload,
+# where a section is its cleaned paragraphs joined by SEPARATOR. Identical sections
+# (e.g. a shared conclusion) are stored once. The file is opened with mmap and a
+# year is only decoded when it is looked up, straight from a slice of the mapping.
+# -------------------------------
+MAGIC = b"WBIDX1\n\0"
+HEADER = struct.Struct("<8sQ")
+SEPARATOR = "\x1e"
+
+
+def build_indexed(content: dict, meta: dict) -> bytes:
+    payload = bytearray()
+    spans = {}
+
+    def span(blocks: list) -> list:
+        text = SEPARATOR.join(blocks)
+        found = spans.get(text)
+        if found is None:
+            if any(SEPARATOR in p for p in blocks):
+                raise ValueError("paragraphs must not contain the \\x1e separator")
+            data = text.encode("utf-8")
+            found = spans[text] = [len(payload), len(data)]
+            payload.extend(data)
+        return found
+
+    niches = {
+        niche: {
+            year: {key: span(blocks) for key, blocks in year_payload.items()}
+            for year, year_payload in (specialism.get("years") or {}).items()
+        }
+        for niche, specialism in content.items()
+    }
+
+    index = json.dumps({"meta": meta, "niches": niches}, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return HEADER.pack(MAGIC, len(index)) + index + bytes(payload)
+
+
+class _IndexedYears(Mapping):
+    # Read-only year -> YearPayload mapping that decodes each year on first access.
+
+    def __init__(self, buffer: memoryview, index: dict) -> None:
+        self._buffer = buffer
+        self._index = index
+        self._decoded = {}
+        self._lock = threading.Lock()
+
+    def _decode(self, spans: dict) -> YearPayload:
+        sections = {}
+        for key, (offset, length) in spans.items():
+            # str() over a memoryview slice decodes without copying the bytes first
+            text = str(self._buffer[offset:offset + length], "utf-8")
+            sections[key] = text.split(SEPARATOR) if text else []
+        return YearPayload.from_sections(sections)
+
+    def __getitem__(self, year: str) -> YearPayload:
+        payload = self._decoded.get(year)
+        if payload is None:
+            spans = self._index[year]
+            with self._lock:
+                payload = self._decoded.get(year)
+                if payload is None:
+                    payload = self._decoded[year] = self._decode(spans)
+        return payload
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+class IndexedContent:
+    def __init__(self, path: Path) -> None:
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            index, start = self._read_index(path)
+            self.meta = index["meta"]
+            self._niches = index["niches"]
+        except Exception:
+            # A truncated or damaged file must not leak its mapping
+            self._mmap.close()
+            raise
+        self._payload = memoryview(self._mmap)[start:]
+
+    def _read_index(self, path: Path) -> tuple:
+        # -> (index, payload offset); ValueError for anything that is not a whole index
+        if len(self._mmap) < HEADER.size:
+            raise ValueError(f"{path} is truncated")
+        magic, index_length = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an indexed content file")
+        end = HEADER.size + index_length
+        if end > len(self._mmap):
+            raise ValueError(f"{path} is truncated")
+        index = json.loads(self._mmap[HEADER.size:end].decode("utf-8"))
+        if not isinstance(index, dict) or "meta" not in index or "niches" not in index:
+            raise ValueError(f"{path} has no content index")
+        spans = (span for years in index["niches"].values() for year in years.values() for span in year.values())
+        if max((offset + length for offset, length in spans), default=0) > len(self._mmap) - end:
+            raise ValueError(f"{path} is truncated")
+        return index, end
+
+    @property
+    def years_by_niche(self) -> dict:
+        return {niche: list(years) for niche, years in self._niches.items()}
+
+    def load_specialism(self, niche: str) -> Specialism:
+        index = self._niches[niche]
+        return Specialism(niche, tuple(sorted(index, key=year_sort_key)), _IndexedYears(self._payload, index))
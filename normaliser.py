@@ -0,0 +1,247 @@
+import re
+import string
+import unicodedata
+from collections import Counter
+from time import perf_counter
+
+# -------------------------------
+# Text normaliser (fix glued text + $ issues)
+#
+# The original clean_text ran ~25 sequential re.sub / str.replace passes. The rules
+# below produce byte-identical output with far fewer scans:
+#   - the character-level fixes (zero width, dashes, $ escaping) are one translate(),
+#     and pure-ASCII strings skip NFKC and the translate table altogether
+#   - rules whose matches can never overlap or feed each other share one alternation
+#   - rules that need a digit are skipped outright for digit-free strings, and patterns
+#     are anchored on a cheap leading character class so the scanner can skip ahead
+#   - dead rules are dropped: "in2026" is already split by the letter/digit rule,
+#     "$ 3.7T" can't match once $ is escaped, and SASE -> SASE was a no-op
+# Order still matters between groups (e.g. "653. 4 B" needs the decimal fix before
+# the unit fix), so groups run in the original rule order.
+# benchmarks/clean_text_diff.py checks this against the frozen original.
+# -------------------------------
+ZERO_WIDTH = dict.fromkeys(map(ord, ["\u200B", "\u200C", "\u200D", "\uFEFF"]), None)
+
+CHAR_FIXES = {
+    **ZERO_WIDTH,
+    # Remove em/en dashes
+    ord("—"): "-",
+    ord("–"): "-",
+    # Escape $ so Streamlit doesn't trigger math mode
+    ord("$"): "&#36;",
+}
+
+_HAS_DIGIT = re.compile(r"\d")
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+
+
+class Rule:
+    __slots__ = ("name", "prefix", "branches", "pattern", "repl", "guard")
+
+    def __init__(self, name: str, pattern: str, repl, guard=None, flags: int = 0, branches: tuple = ()) -> None:
+        self.name = name
+        # branches: ((step name, regex), ...) fused after `pattern` as one alternation of
+        # named groups, so repl (and the profiler) tell them apart by m.lastgroup
+        self.prefix = pattern
+        self.branches = branches
+        if branches:
+            pattern += "(?:" + "|".join(f"(?P<{step}>{regex})" for step, regex in branches) + ")"
+        self.pattern = re.compile(pattern, flags)
+        self.repl = repl
+        # guard(s, has_digit) -> bool; a False guard means the rule cannot match
+        self.guard = guard
+
+
+def _needs_digit(s: str, has_digit: bool) -> bool:
+    return has_digit
+
+
+def _split_digit(m) -> str:
+    # Space out a digit glued to an ASCII letter on either side: "a1b" -> "a 1 b"
+    s, i = m.string, m.start()
+    before = " " if i and s[i - 1] in _ASCII_LETTERS else ""
+    after = " " if i + 1 < len(s) and s[i + 1] in _ASCII_LETTERS else ""
+    return before + m.group() + after
+
+
+def _quarter_fy(m) -> str:
+    return "Q" + m["quarter"] if m.lastgroup == "quarter_join" else "FY" + m["fy"]
+
+
+def _units(m) -> str:
+    return m["g"] + "G" if m.lastgroup == "g_join" else m["ghz"] + "GHz"
+
+
+def _tokens(m) -> str:
+    if m.lastgroup == "q_token_join":
+        return "Q" + m["q"]
+    return "DDoS" if m.lastgroup == "ddos_join" else "SD-WAN"
+
+
+RULES = (
+    # Fix missing space after full stop
+    Rule("full_stop_space", r"\.([A-Za-z0-9])", r". \1",
+         guard=lambda s, d: "." in s),
+    # Fix glued digit-letter boundaries ("5Gin" -> "5 G in")
+    Rule("digit_letter_split", r"\d(?:(?<=[A-Za-z]\d)|(?=[A-Za-z]))", _split_digit,
+         guard=_needs_digit),
+    # Fix quarters / financial years: "Q 1" -> "Q1", "FY 24" -> "FY24"
+    Rule("quarter_fy_join", r"(?=[QqFf])\b", _quarter_fy, guard=_needs_digit, flags=re.IGNORECASE,
+         branches=(("quarter_join", r"Q\s+(?P<quarter>[1-4])\b"), ("fy_join", r"FY\s+(?P<fy>\d{2,4})\b"))),
+    # Fix all decimal spacing: "653. 4" -> "653.4"
+    Rule("decimal_join", r"(\d+)\.\s+(\d+)", r"\1.\2",
+         guard=lambda s, d: d and "." in s),
+    # Fix number + unit spacing: "3.7 T" -> "3.7T", "12.5 %" -> "12.5%"
+    Rule("unit_join", r"(\d+(?:\.\d+)?)\s*(T|B|M|K|%)\b", r"\1\2",
+         guard=_needs_digit),
+    # Fix AI casing globally + collapse multiple spaces
+    Rule("ai_case_and_spaces", r"(?=[aA ])", lambda m: "AI" if m.lastgroup == "ai_case" else " ",
+         branches=(("ai_case", r"(?i:\bai\b)"), ("space_collapse", r"[ ]{2,}"))),
+    # Join "5 G" -> "5G" and "5 GHz" -> "5GHz"
+    Rule("g_ghz_join", r"(?=\d)\b", _units, guard=_needs_digit,
+         branches=(("g_join", r"(?P<g>[3-6])\s+G\b"), ("ghz_join", r"(?P<ghz>\d+)\s+(?i:GHz)\b"))),
+    # Re-join tech tokens: "Q 1" / "q1" -> "Q1", "DDo S" -> "DDoS", "SD - WAN" -> "SD-WAN"
+    Rule("token_join", r"(?=[QqDSs])\b", _tokens, guard=lambda s, d: d or "-" in s or "DDo" in s,
+         branches=(("q_token_join", r"(?i:Q\s*(?P<q>[1-4])\b)"), ("ddos_join", r"DDo\s+S\b"),
+                   ("sdwan_join", r"(?i:SD\s*-\s*WAN\b)"))),
+)
+
+
+def clean_text(s: str) -> str:
+    if not isinstance(s, str):
+        return s
+
+    if s.isascii():
+        # NFKC is the identity on ASCII and none of the other char fixes can apply
+        s = s.replace("$", "&#36;")
+    else:
+        s = unicodedata.normalize("NFKC", s).translate(CHAR_FIXES)
+    has_digit = _HAS_DIGIT.search(s) is not None
+
+    for rule in RULES:
+        if rule.guard is None or rule.guard(s, has_digit):
+            s = rule.pattern.sub(rule.repl, s)
+
+    return s.strip()
+
+
+def walk(obj):
+    if isinstance(obj, dict):
+        return {k: walk(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [walk(v) for v in obj]
+    if isinstance(obj, str):
+        return clean_text(obj)
+    return obj
+
+
+# -------------------------------
+# Profiling mode (benchmarks/clean_text_profile.py)
+#
+# profile_clean_text mirrors clean_text step by step, so keep the two in step. It
+# records per rule how often the guard let it run, how many strings it changed, how
+# many matches it actually changed (subn() also counts "AI" -> "AI"), the time spent
+# and a few before/after examples. Each branch of a fused rule is a step of its own:
+# hits are told apart by m.lastgroup, and its time is what scanning for that branch
+# alone costs (the fused rule's own time is the one clean_text pays).
+# -------------------------------
+class RuleProfile:
+    __slots__ = ("name", "calls", "skipped", "changed", "hits", "seconds", "slowest", "slowest_input", "examples")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0  # times the rule ran (guard passed)
+        self.skipped = 0  # times the guard ruled it out
+        self.changed = 0  # strings it changed
+        self.hits = 0  # matches whose replacement changed the text
+        self.seconds = 0.0
+        self.slowest = 0.0
+        self.slowest_input = ""
+        self.examples = []  # [(before, after)]
+
+    def add(self, before: str, after: str, hits: int, seconds: float, max_examples: int) -> None:
+        self.calls += 1
+        self.hits += hits
+        self.seconds += seconds
+        if seconds > self.slowest:
+            self.slowest = seconds
+            self.slowest_input = before
+        if after != before:
+            self.changed += 1
+            if len(self.examples) < max_examples:
+                self.examples.append((before, after))
+
+
+PROFILE_STEPS = (
+    ("char_fixes",)
+    + tuple(step for rule in RULES for step in (rule.name, *(branch for branch, _ in rule.branches)))
+    + ("strip",)
+)
+BRANCH_OF = {branch: rule.name for rule in RULES for branch, _ in rule.branches}
+_BRANCH_PATTERNS = {
+    rule.name: tuple(
+        (branch, re.compile(f"{rule.prefix}(?:{regex})", rule.pattern.flags)) for branch, regex in rule.branches
+    )
+    for rule in RULES
+}
+
+
+def new_profiles() -> dict:
+    return {name: RuleProfile(name) for name in PROFILE_STEPS}
+
+
+def _effective_hits(rule: Rule, s: str) -> Counter:
+    # step -> matches whose replacement changed the text, by branch for fused rules.
+    # Run outside the timed pass, so counting does not inflate the rule's time.
+    hits = Counter()
+
+    def count(m) -> str:
+        out = rule.repl(m) if callable(rule.repl) else m.expand(rule.repl)
+        if out != m.group():
+            hits[m.lastgroup if rule.branches else rule.name] += 1
+        return out
+
+    rule.pattern.sub(count, s)
+    return hits
+
+
+def profile_clean_text(s: str, profiles: dict, max_examples: int = 3) -> str:
+    # Same result as clean_text(s), with every step accounted for in profiles
+    if not isinstance(s, str):
+        return s
+
+    start = perf_counter()
+    if s.isascii():
+        fixed = s.replace("$", "&#36;")
+    else:
+        fixed = unicodedata.normalize("NFKC", s).translate(CHAR_FIXES)
+    profiles["char_fixes"].add(s, fixed, int(fixed != s), perf_counter() - start, max_examples)
+    s = fixed
+    has_digit = _HAS_DIGIT.search(s) is not None
+
+    for rule in RULES:
+        profile = profiles[rule.name]
+        branches = _BRANCH_PATTERNS[rule.name]
+        if rule.guard is not None and not rule.guard(s, has_digit):
+            profile.skipped += 1
+            for branch, _ in branches:
+                profiles[branch].skipped += 1
+            continue
+        start = perf_counter()
+        after = rule.pattern.sub(rule.repl, s)
+        seconds = perf_counter() - start
+        hits = _effective_hits(rule, s)
+        profile.add(s, after, sum(hits.values()), seconds, max_examples)
+
+        for branch, pattern in branches:
+            start = perf_counter()
+            for _ in pattern.finditer(s):
+                pass
+            seconds = perf_counter() - start
+            profiles[branch].add(s, after if hits[branch] else s, hits[branch], seconds, max_examples)
+        s = after
+
+    start = perf_counter()
+    stripped = s.strip()
+    profiles["strip"].add(s, stripped, int(stripped != s), perf_counter() - start, max_examples)
+    return stripped
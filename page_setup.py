@@ -0,0 +1,23 @@
+import streamlit as st
+
+import content_store
+
+
+def load_store(path=content_store.DATA_PATH) -> content_store.ContentStore:
+    # The process-wide, cleaned store shared by app.py and every page; shows the
+    # problem and stops the script when content.json is missing, invalid or empty
+    if not content_store.source_exists(path):
+        st.error("Missing data/content.json")
+        st.stop()
+
+    try:
+        store = content_store.get_store(path)
+    except Exception as e:
+        st.error("content.json is not valid JSON")
+        st.code(str(e))
+        st.stop()
+
+    if not store.niches:
+        st.warning("No specialisms found in content.json")
+        st.stop()
+    return store
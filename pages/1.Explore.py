@@ -1,27 +1,14 @@
-import json
-from pathlib import Path
 import streamlit as st
 
+import page_setup
+import render
+
 st.set_page_config(page_title="The Tech Wayback Machine", layout="wide")
 st.title("Tech Wayback Machine")
 
-DATA_PATH = Path("data/content.json")
-
-if not DATA_PATH.exists():
-    st.error("Missing data/content.json")
-    st.stop()
-
-try:
-    content = json.loads(DATA_PATH.read_text(encoding="utf-8"))
-except Exception as e:
-    st.error("content.json is not valid JSON")
-    st.code(str(e))
-    st.stop()
-
-niches = sorted(content.keys())
-if not niches:
-    st.warning("No niches found in content.json")
-    st.stop()
+# Same process-wide, cleaned store as app.py (resolved relative to the package, not the CWD)
+store = page_setup.load_store()
+niches = store.niches
 
 with st.sidebar:
     st.header("Choose your path")
@@ -32,14 +19,16 @@ with st.sidebar:
 
 st.subheader(f"{niche} — {year}")
 
-paragraphs = content.get(niche, {}).get(year, [])
+year_payload = store.get_year_payload(niche, year)
+
+paragraphs = [p for key, _ in render.SECTION_ORDER for p in year_payload[key]]
 if not paragraphs:
     st.info("No content for this selection yet.")
 else:
     for p in paragraphs:
         st.write(p)
 
-conclusion = content.get(niche, {}).get("conclusion", [])
+conclusion = year_payload["conclusion"]
 if conclusion:
     st.divider()
     st.markdown("### What this means 🧠")
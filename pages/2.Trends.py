@@ -0,0 +1,64 @@
+import pandas as pd
+import streamlit as st
+
+import page_setup
+import trends
+
+st.set_page_config(page_title="The Tech Wayback Machine", layout="wide")
+st.title("Theme Trends")
+st.write("How often each theme comes up per 1,000 words, by specialism, from year to year.")
+
+store = page_setup.load_store()
+
+# Term-document matrix built once per content version (see trends.py)
+matrix = trends.get_matrix(store)
+
+ALL_NICHES = "All specialisms"
+
+with st.sidebar:
+    st.header("Choose your themes")
+    themes_input = st.text_input("Themes (comma separated)", ", ".join(trends.DEFAULT_THEMES))
+    scope = st.selectbox("Specialism", [ALL_NICHES] + matrix.niches)
+
+themes = [t.strip() for t in themes_input.split(",") if t.strip()]
+niche = None if scope == ALL_NICHES else scope
+
+unknown = [t for t in themes if matrix.term_id(t) is None]
+if unknown:
+    st.caption("Not found in the content: " + ", ".join(unknown))
+
+# -------------------------------
+# Trend lines
+# -------------------------------
+if themes:
+    st.subheader(f"{scope}: theme trends")
+    st.line_chart(pd.DataFrame(matrix.rates(themes, niche), index=matrix.years, columns=themes))
+
+    theme = st.selectbox("Compare specialisms on", themes)
+    st.subheader(f"{theme} across specialisms")
+    st.line_chart(pd.DataFrame(matrix.by_niche(theme), index=matrix.years, columns=matrix.niches))
+
+# -------------------------------
+# Top movers
+# -------------------------------
+window = min(3, len(matrix.years) // 2) or 1
+first, last = matrix.years[:window], matrix.years[-window:]
+st.subheader(f"{scope}: top movers")
+st.caption(f"Change in mentions per 1,000 words, {first[0]}–{first[-1]} vs {last[0]}–{last[-1]}")
+
+
+def movers_frame(table) -> pd.DataFrame:
+    terms, early, late, change = table
+    return pd.DataFrame(
+        {"Term": terms, first[0] + "–" + first[-1]: early, last[0] + "–" + last[-1]: late, "Change": change}
+    ).round(2)
+
+
+rising, falling = matrix.movers(niche, window=window)
+left, right = st.columns(2)
+with left:
+    st.markdown("**Rising**")
+    st.dataframe(movers_frame(rising), hide_index=True)
+with right:
+    st.markdown("**Falling**")
+    st.dataframe(movers_frame(falling), hide_index=True)
@@ -0,0 +1,51 @@
+import streamlit as st
+
+import compare
+import page_setup
+import render
+
+st.set_page_config(page_title="The Tech Wayback Machine", layout="wide")
+st.title("Year vs Year")
+st.write("Two years of a specialism side by side: what was said then, what is said now, and what changed.")
+
+store = page_setup.load_store()
+
+st.markdown(f"<style>{render.GLASS_CARD_CSS}{compare.COMPARE_CSS}</style>", unsafe_allow_html=True)
+
+with st.sidebar:
+    st.header("Choose what to compare")
+    niche = st.selectbox("Specialism", store.niches)
+    years = store.available_years_for(niche)
+    only_changes = st.toggle("Only sections that changed", value=False)
+
+if len(years) < 2:
+    st.info("This specialism needs at least two years to compare.")
+    st.stop()
+
+year_a, year_b = st.select_slider("Years", options=years, value=(years[0], years[-1]))
+if year_a == year_b:
+    st.info("Pick two different years.")
+    st.stop()
+
+# Diffed once per content version and shared by every session (see compare.py);
+# the niche's other pairs are filled in behind this one
+sections = compare.compared_years(store, niche, year_a, year_b)
+compare.prewarm_in_background(store, niche)
+
+st.subheader(f"{niche}: {year_a} → {year_b}")
+left, right = st.columns(2)
+left.markdown(f"#### {year_a}")
+right.markdown(f"#### {year_b}")
+
+shown = 0
+for title, before, after, changed in sections:
+    if only_changes and not changed:
+        continue
+    shown += 1
+    st.markdown(f"### {title}" + ("" if changed else " · unchanged"))
+    left, right = st.columns(2)
+    left.markdown(before, unsafe_allow_html=True)
+    right.markdown(after, unsafe_allow_html=True)
+
+if not shown:
+    st.info("Nothing changed between these years.")
@@ -0,0 +1,514 @@
+import html
+import json
+import threading
+from collections import Counter, OrderedDict
+
+import content_store
+from content_model import YearPayload
+
+# -------------------------------
+# Shared HTML for the year view (app.py, client-side timeline)
+# -------------------------------
+SECTION_ORDER = [
+    ("market_shift", "Market Shifts"),
+    ("technical_shift", "Technical Shifts"),
+    ("talent_shift", "Talent Shifts"),
+    ("investment", "Investment Contexts 💵"),
+]
+
+GLASS_CARD_CSS = """/* Glass card box */
+.glass-card {
+    background: rgba(255, 255, 255, 0.55);
+    border: 1px solid rgba(0, 0, 0, 0.08);
+    border-radius: 18px;
+    padding: 1.3rem 1.5rem;
+    margin-top: 0.6rem;
+    margin-bottom: 1.6rem;
+    backdrop-filter: blur(10px);
+    -webkit-backdrop-filter: blur(10px);
+    box-shadow: 0 10px 30px rgba(0,0,0,0.06);
+}
+
+.glass-card p {
+    margin: 0 0 0.9rem 0;
+    line-height: 1.6;
+}
+
+.glass-card p:last-child {
+    margin-bottom: 0;
+}
+"""
+
+
+def glass_card_html(blocks: list) -> str:
+    box_html = '<div class="glass-card">'
+    for p in blocks:
+        box_html += f"<p>{p}</p>"
+    box_html += "</div>"
+    return box_html
+
+
+def conclusion_html(conclusion: list) -> str:
+    box_html = """
+    <div class="glass-card">
+        <div style="font-size: 1.4rem; font-weight: 600; margin-bottom: 0.8rem;">
+            What this means 🧠
+        </div>
+    """
+
+    for p in conclusion:
+        box_html += f"<p>{p}</p>"
+
+    box_html += "</div>"
+    return box_html
+
+
+def year_body_html(year_payload: YearPayload) -> str:
+    # Sections + conclusion for one year as plain HTML (headings included)
+    parts = []
+    for key, title in SECTION_ORDER:
+        blocks = year_payload[key]
+        if blocks:
+            parts.append(f"<h3>{title}</h3>{glass_card_html(blocks)}")
+
+    conclusion = year_payload["conclusion"]
+    parts.append("<hr>")
+    if conclusion:
+        parts.append(conclusion_html(conclusion))
+    return "".join(parts)
+
+
+# -------------------------------
+# Client-side timeline: every year of a niche in one component, switched in the browser
+# -------------------------------
+TIMELINE_CSS = """
+body {
+    margin: 0;
+    font-family: "Source Sans Pro", sans-serif;
+    color: #000000;
+    background: transparent;
+}
+
+h2, h3 {
+    margin-top: 1.4rem;
+}
+
+hr {
+    border: none;
+    border-top: 1px solid rgba(49, 51, 63, 0.2);
+    margin: 2rem 0;
+}
+
+.timeline-label {
+    font-size: 0.875rem;
+}
+
+.timeline-slider {
+    width: 100%;
+    accent-color: #7ac043;
+}
+
+.timeline-ticks {
+    display: flex;
+    justify-content: space-between;
+    font-size: 0.8rem;
+}
+"""
+
+
+def timeline_html(niche: str, payloads: dict) -> str:
+    # payloads: year -> year payload, in slider order
+    years = list(payloads)
+    bodies = "".join(
+        f'<div class="timeline-year" data-year="{year}"{"" if i == 0 else " hidden"}>'
+        f"{year_body_html(payload)}</div>"
+        for i, (year, payload) in enumerate(payloads.items())
+    )
+
+    return f"""
+    <html>
+    <head>
+    <style>
+    {TIMELINE_CSS}
+    {GLASS_CARD_CSS}
+    </style>
+    </head>
+    <body>
+        <label class="timeline-label" for="timeline-slider">Range Slider</label>
+        <input class="timeline-slider" id="timeline-slider" type="range"
+               min="0" max="{len(years) - 1}" step="1" value="0">
+        <div class="timeline-ticks"><span>{years[0]}</span><span>{years[-1]}</span></div>
+
+        <h2 id="timeline-heading">{html.escape(niche)}: {years[0]}</h2>
+        {bodies}
+
+        <script>
+        const niche = {json.dumps(niche)};
+        const years = {json.dumps(years)};
+        const slider = document.getElementById("timeline-slider");
+        const heading = document.getElementById("timeline-heading");
+        const bodies = document.querySelectorAll(".timeline-year");
+
+        slider.addEventListener("input", () => {{
+            const year = years[slider.value];
+            heading.textContent = `${{niche}}: ${{year}}`;
+            bodies.forEach((el) => {{ el.hidden = el.dataset.year !== year; }});
+        }});
+        </script>
+    </body>
+    </html>
+    """
+
+
+def timeline_height(payloads: dict) -> int:
+    # The embedded timeline gets a fixed height: size it for the longest year so
+    # scrubbing never clips (roughly 95 characters per 26px line at 900px wide).
+    def year_height(payload: YearPayload) -> int:
+        height = 0
+        for key in [k for k, _ in SECTION_ORDER] + ["conclusion"]:
+            blocks = payload[key]
+            if blocks:
+                height += 110 + sum((len(p) // 95 + 1) * 26 + 14 for p in blocks)
+        return height
+
+    return 220 + max((year_height(p) for p in payloads.values()), default=0)
+
+
+# -------------------------------
+# Render cache
+# Output depends only on (niche content version, niche, year), so it is built once and
+# shared by every session; the LRU bound keeps memory flat as the catalogue grows.
+# Entries of niches a content reload did not touch stay valid; the rest are dropped.
+# -------------------------------
+RENDER_CACHE_SIZE = 512
+
+
+class RenderCache:
+    def __init__(self, maxsize: int = RENDER_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, build):
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                return self._items[key]
+
+        # Built outside the lock; two sessions racing on a cold key both render, which is harmless
+        value = build()
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+        return value
+
+    def discard_niches(self, niches) -> int:
+        # Keys are (niche version, kind, niche, ...)
+        with self._lock:
+            stale = [key for key in self._items if key[2] in niches]
+            for key in stale:
+                del self._items[key]
+        return len(stale)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+CACHE = RenderCache()
+
+
+def _year_view(year_payload: YearPayload) -> tuple:
+    sections = tuple(
+        (f"### {title}", glass_card_html(year_payload[key]))
+        for key, title in SECTION_ORDER
+        if year_payload[key]
+    )
+    conclusion = year_payload["conclusion"]
+    return sections, conclusion_html(conclusion) if conclusion else ""
+
+
+def rendered_year(store, niche: str, year: str) -> tuple:
+    # -> ((title markdown, card html), ...), conclusion html ("" when there is none)
+    return CACHE.get(
+        (store.niche_version(niche), "year", niche, year),
+        lambda: _year_view(store.get_year_payload(niche, year)),
+    )
+
+
+def rendered_timeline(store, niche: str, years: list) -> tuple:
+    # -> (component html, height) for the client-side slider
+    def build():
+        payloads = {year: store.get_year_payload(niche, year) for year in years}
+        return timeline_html(niche, payloads), timeline_height(payloads)
+
+    return CACHE.get((store.niche_version(niche), "timeline", niche, tuple(years)), build)
+
+
+def prewarm(store, limit: int = None) -> int:
+    # Render every (niche, year) up front; loads every specialism, so it is opt-in.
+    # At most `limit` (the cache size) pages, popular ones last so a catalogue larger
+    # than the cache never evicts the pages people actually visit.
+    limit = CACHE.maxsize if limit is None else limit
+    popular = popular_pages(store)[:limit]
+    skip = set(popular)
+    pages = [
+        (niche, year)
+        for niche in store.niches
+        for year in store.available_years_for(niche)
+        if (niche, year) not in skip
+    ]
+    pages = pages[:limit - len(popular)] + popular
+    for niche, year in pages:
+        rendered_year(store, niche, year)
+    return len(pages)
+
+
+# -------------------------------
+# Popular pages
+# Shared links land on a handful of (niche, year) pages. Visits are counted per
+# process, and the most visited pages are rendered ahead of time: once per content
+# version at startup, and again for the niches a reload changed. Until there are
+# visits to go by, each niche's first and latest year stand in. A deep link's first
+# paint is then a cache hit with no content processing. A sharded store only warms
+# niches a visitor already loaded, so startup still reads nothing but its manifest.
+# -------------------------------
+POPULAR_PAGES = 32
+
+_visits = Counter()  # (niche, year) -> visits
+_warm_lock = threading.Lock()
+_warmed = set()  # content versions already warmed
+
+
+def record_visit(niche: str, year: str) -> None:
+    with _warm_lock:
+        _visits[(niche, year)] += 1
+
+
+def popular_pages(store, limit: int = POPULAR_PAGES) -> list:
+    with _warm_lock:
+        ranked = [page for page, _ in _visits.most_common(limit)]
+    pages = [(niche, year) for niche, year in ranked if year in store.available_years_for(niche)]
+    for niche in store.niches:
+        years = store.available_years_for(niche)
+        pages += [(niche, year) for year in dict.fromkeys(years[:1] + years[-1:]) if (niche, year) not in pages]
+        if len(pages) >= limit:
+            break
+    return pages[:limit]
+
+
+def warm_popular(store, niches=None) -> int:
+    pages = [
+        (niche, year)
+        for niche, year in popular_pages(store)
+        if (niches is None or niche in niches) and (not store.lazy or store.is_loaded(niche))
+    ]
+    for niche, year in pages:
+        rendered_year(store, niche, year)
+    return len(pages)
+
+
+def _first_warm(store) -> bool:
+    # True for the first caller per content version; full runs call this every time
+    with _warm_lock:
+        if store.version in _warmed:
+            return False
+        _warmed.add(store.version)
+        return True
+
+
+def warm_popular_in_background(store, niches=None) -> None:
+    # Once per content version unless specific (reloaded) niches are given
+    if niches is None and not _first_warm(store):
+        return
+    threading.Thread(target=warm_popular, args=(store, niches), name="render-warm", daemon=True).start()
+
+
+def prewarm_in_background(store) -> None:
+    # prewarm() once per content version, off the first session's run
+    if _first_warm(store):
+        threading.Thread(target=prewarm, args=(store,), name="render-prewarm", daemon=True).start()
+
+
+def _on_reload(previous, store, changed) -> None:
+    CACHE.discard_niches(changed)
+    # Only the changed niches lost their rendered pages; everything else stays warm
+    with _warm_lock:
+        _warmed.add(store.version)
+    warm_popular_in_background(store, changed)
+
+
+content_store.on_reload(_on_reload)
+
+
+# -------------------------------
+# Footer links + tools hub (app.py, static export)
+# -------------------------------
+FOOTER_LINKS = [
+    ("Home", "https://www.hamilton-barnes.com/"),
+    ("Explore Roles", "https://www.hamilton-barnes.com/jobs"),
+    ("Candidates", "https://www.hamilton-barnes.com/candidates"),
+    ("Clients", "https://www.hamilton-barnes.com/clients"),
+    ("Graduates", "https://www.empowering-future-network-engineers.com/")
+]
+
+FOOTER_HEADING = "<h3 style='text-align: center;'>Explore Hamilton Barnes 🌳</h3>"
+
+
+def footer_button_html(label: str, url: str) -> str:
+    return f"""
+        <a href="{url}" target="_blank">
+            <button style="
+                width: 100%;
+                padding: 0.25rem;
+                margin-bottom: 0.5rem;
+                border-radius: 5px;
+                border: 1px solid #b5c1cf;
+                background-color: transparent;
+                color: black;
+                cursor: pointer;
+                font-weight: 430;
+            ">
+                {label}
+            </button>
+        </a>
+        """
+
+
+def tools_hub_html(current_tool: str) -> str:
+    # The "Explore More Interactive Tools" document (an iframe in app.py and the export)
+    tools = [
+        {
+            "name": "Candidate Market Insight",
+            "url": "https://www.hamilton-barnes.com/candidate-market-insight",
+            "summary": "Explore broader candidate-side market trends, hiring movement, and skill demand across selected technology areas to better understand where the market is shifting."
+        },
+        {
+            "name": "UK Salary Calculator",
+            "url": "https://hamilton-barnes-salary-calculator-uk.streamlit.app/",
+            "summary": "Benchmark salary expectations across the UK market using role, level, and location inputs designed to help candidates and hiring teams sense-check compensation more clearly."
+        },
+        {
+            "name": "Germany Salary Calculator",
+            "url": "https://hamilton-barnes-germany-salary-calculator.streamlit.app/",
+            "summary": "Benchmark salary expectations across the German market using role, level, and location inputs to give users a more practical view of market positioning."
+        },
+        {
+            "name": "Wayback Machine",
+            "url": "https://hamilton-barnes-wayback-machine.streamlit.app/",
+            "summary": "Explore how each specialism has evolved over time across market shifts, technical development, talent demand, and investment context through a structured year-by-year view."
+        },
+    ]
+
+    visible_tools = [tool for tool in tools if tool["name"] != current_tool]
+
+    cards_html = ""
+    for tool in visible_tools:
+        cards_html += f"""
+        <div class="hb-tool-card">
+            <div class="hb-tool-card-title">{tool["name"]}</div>
+            <div class="hb-tool-card-line">{tool["summary"]}</div>
+            <a class="hb-tool-card-link" href="{tool["url"]}" target="_blank">Open tool</a>
+        </div>
+        """
+
+    full_html = f"""
+    <html>
+    <head>
+    <style>
+        body {{
+            margin: 0;
+            font-family: Arial, sans-serif;
+            color: #000000;
+            background: transparent;
+        }}
+
+        .tools-hub-wrap {{
+            margin-top: 0.5rem;
+        }}
+
+        .tools-hub-title {{
+            text-align: center;
+            font-size: 1.7rem;
+            font-weight: 700;
+            margin-bottom: 0.5rem;
+        }}
+
+        .tools-hub-subtitle {{
+            text-align: center;
+            font-size: 0.95rem;
+            max-width: 760px;
+            margin: 0 auto 1.6rem auto;
+            line-height: 1.6;
+        }}
+
+        .tools-grid {{
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            gap: 18px;
+        }}
+
+        .hb-tool-card {{
+            background: rgba(255, 255, 255, 0.58);
+            border: 1px solid rgba(0, 0, 0, 0.08);
+            border-radius: 22px;
+            padding: 1.15rem 1.2rem 1rem 1.2rem;
+            backdrop-filter: blur(10px);
+            -webkit-backdrop-filter: blur(10px);
+            box-shadow: 0 10px 26px rgba(0, 0, 0, 0.05);
+        }}
+
+        .hb-tool-card-title {{
+            font-size: 1.15rem;
+            font-weight: 700;
+            margin-bottom: 0.6rem;
+        }}
+
+        .hb-tool-card-line {{
+            font-size: 0.9rem;
+            line-height: 1.5;
+            margin-bottom: 0.35rem;
+        }}
+
+        .hb-tool-card-link {{
+            display: inline-block;
+            margin-top: 0.6rem;
+            padding: 0.25rem 0.8rem;
+            border-radius: 999px;
+            border: 1px solid #b5c1cf;
+            background: transparent;
+            color: black;
+            text-decoration: none;
+            font-size: 0.82rem;
+            font-weight: 500;
+        }}
+
+        .hb-tool-card-link:hover {{
+            border-color: #7ac043;
+            color: #7ac043;
+        }}
+
+        @media (max-width: 768px) {{
+            .tools-grid {{
+                grid-template-columns: 1fr;
+            }}
+        }}
+    </style>
+    </head>
+    <body>
+        <div class="tools-hub-wrap">
+            <div class="tools-hub-title">Explore More Interactive Tools</div>
+            <div class="tools-hub-subtitle">
+                Explore the rest of the Hamilton Barnes interactive toolset below. Each one is designed to help users better understand salary benchmarks, market positioning, or long-term specialism shifts, while making it easier to move between related tools.
+            </div>
+
+            <div class="tools-grid">
+                {cards_html}
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+
+    return full_html
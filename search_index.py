@@ -0,0 +1,210 @@
+import html
+import re
+from collections import Counter
+from typing import NamedTuple
+
+import numpy as np
+
+import content_store
+from content_store import YEAR_KEYS, year_sort_key
+
+# -------------------------------
+# Full-text search over the cleaned paragraphs
+#
+# An inverted index is built once per content version: normalised token -> postings
+# of (document, BM25 term weight), where a document is one paragraph at
+# (niche, section, paragraph index) with the years it appears in. Weights are
+# precomputed at build time, so a query is a sum over the postings of its terms and
+# a top-k selection. Tokenising is done per niche and reused across reloads that did
+# not touch the niche.
+# -------------------------------
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:[-/.][a-z0-9]+)*")
+PART_RE = re.compile(r"[-/.]")
+# Content uses typographic hyphens ("SD‐WAN"); index them like "-"
+HYPHENS = dict.fromkeys(map(ord, "\u2010\u2011\u2012"), "-")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by does do for from how in into is it of on or show shows "
+    "shown that the this to up was were what when where which who with".split()
+)
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+# Added per matched query term; larger than any single BM25 term weight can be
+COORDINATION_BONUS = 1000.0
+
+
+def normalise(text: str) -> str:
+    if "&" in text:
+        text = html.unescape(text)
+    return text.translate(HYPHENS).lower()
+
+
+def tokenize(text: str, parts: bool = True) -> list:
+    # "SD-WAN" indexes as "sd-wan", "sd" and "wan", so "SD-WAN" and "WAN" both find it
+    tokens = TOKEN_RE.findall(normalise(text))
+    if parts:
+        tokens += [part for token in tokens if PART_RE.search(token) for part in PART_RE.split(token) if part]
+    return tokens
+
+
+def query_terms(query: str) -> list:
+    # Compound terms are looked up whole, so "SD-WAN" counts as one matched term
+    return list(dict.fromkeys(t for t in tokenize(query, parts=False) if t not in STOPWORDS))
+
+
+class Hit(NamedTuple):
+    niche: str
+    section: str
+    years: tuple
+    paragraph: int
+    text: str
+    score: float
+    matched: int
+
+
+class _Segment:
+    # One niche's paragraphs and token counts. Reused by the next index while the
+    # niche's content version is unchanged, so a reload only re-tokenises edited niches.
+    def __init__(self, store, niche: str) -> None:
+        self.version = store.niche_version(niche)
+        self.docs = []  # [niche, section, paragraph index, text, years]
+        by_key = {}
+        counted = {}  # text -> (token counts, length), so repeats are tokenised once
+        vocabulary = {}
+        term_ids, doc_ids, tfs, lengths = [], [], [], []
+
+        for year in store.available_years_for(niche):
+            year_payload = store.get_year_payload(niche, year)
+            for section in YEAR_KEYS:
+                for i, text in enumerate(year_payload[section]):
+                    doc = by_key.get((section, i, text))
+                    if doc is not None:
+                        self.docs[doc][4].append(year)
+                        continue
+
+                    doc = by_key[(section, i, text)] = len(self.docs)
+                    self.docs.append([niche, section, i, text, [year]])
+                    counts = counted.get(text)
+                    if counts is None:
+                        tokens = tokenize(text)
+                        counts = counted[text] = (Counter(tokens).items(), len(tokens))
+                    lengths.append(counts[1])
+                    for token, tf in counts[0]:
+                        term_ids.append(vocabulary.setdefault(token, len(vocabulary)))
+                        doc_ids.append(doc)
+                        tfs.append(tf)
+
+        self.terms = list(vocabulary)
+        self.term_ids = np.array(term_ids, dtype=np.int32)
+        self.doc_ids = np.array(doc_ids, dtype=np.int32)
+        self.tfs = np.array(tfs, dtype=np.float32)
+        self.lengths = np.array(lengths, dtype=np.float32)
+
+
+class SearchIndex:
+    def __init__(self, store, previous: "SearchIndex" = None) -> None:
+        # A document is one distinct paragraph per (niche, section, paragraph index);
+        # the same text repeated across years (e.g. a shared conclusion) is indexed
+        # once and carries every year it appears in.
+        self.version = store.version
+        self.segments = {}
+        for niche in store.niches:
+            segment = previous.segments.get(niche) if previous else None
+            if segment is None or segment.version != store.niche_version(niche):
+                segment = _Segment(store, niche)
+            self.segments[niche] = segment
+
+        # Stitch the segments into one index: BM25 idf and average length are global,
+        # so weights are recomputed over all postings (vectorised, no per-posting Python)
+        self.docs = []
+        self._vocabulary = {}
+        cols, rows, tfs, lengths = [], [], [], []
+        for segment in self.segments.values():
+            term_map = np.fromiter(
+                (self._vocabulary.setdefault(t, len(self._vocabulary)) for t in segment.terms),
+                dtype=np.int32, count=len(segment.terms),
+            )
+            cols.append(term_map[segment.term_ids])
+            rows.append(segment.doc_ids + len(self.docs))
+            tfs.append(segment.tfs)
+            lengths.append(segment.lengths)
+            self.docs.extend(segment.docs)
+
+        empty_i, empty_f = np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32)
+        cols = np.concatenate(cols) if cols else empty_i
+        rows = np.concatenate(rows) if rows else empty_i
+        tfs = np.concatenate(tfs) if tfs else empty_f
+        lengths = np.concatenate(lengths) if lengths else empty_f
+
+        n_docs = len(self.docs) or 1
+        avg_length = float(lengths.mean()) if len(lengths) and lengths.mean() else 1.0
+        df = np.bincount(cols, minlength=len(self._vocabulary))
+        idf = np.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+        norm = K1 * (1 - B + B * lengths[rows] / avg_length)
+        weights = idf[cols] * tfs * (K1 + 1) / (tfs + norm)
+
+        # Postings by term (CSC): rows/weights[indptr[t]:indptr[t + 1]]
+        order = np.argsort(cols, kind="stable")
+        self._rows = rows[order]
+        self._weights = weights[order].astype(np.float32)
+        self._indptr = np.searchsorted(cols[order], np.arange(len(self._vocabulary) + 1))
+
+    def search(self, query: str, limit: int = 20) -> list:
+        term_ids = [self._vocabulary[t] for t in query_terms(query) if t in self._vocabulary]
+        if not term_ids:
+            return []
+
+        # score = matched terms * COORDINATION_BONUS + BM25 in one float, so any
+        # paragraph matching more terms outranks one matching fewer.
+        spans = [slice(self._indptr[t], self._indptr[t + 1]) for t in term_ids]
+        rows = np.concatenate([self._rows[span] for span in spans])
+        weights = np.concatenate([self._weights[span] for span in spans]) + COORDINATION_BONUS
+        scores = np.bincount(rows, weights=weights, minlength=len(self.docs))
+
+        candidates = np.flatnonzero(scores)
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit)[:limit]]
+        top = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        hits = []
+        for doc in top.tolist():
+            niche, section, paragraph, text, years = self.docs[doc]
+            score = float(scores[doc])
+            matched = int(score // COORDINATION_BONUS)
+            hits.append(Hit(
+                niche=niche,
+                section=section,
+                years=tuple(sorted(years, key=year_sort_key)),
+                paragraph=paragraph,
+                text=text,
+                score=score - matched * COORDINATION_BONUS,
+                matched=matched,
+            ))
+        return hits
+
+
+def snippet(text: str, query: str, width: int = 220, mark: str = "**") -> str:
+    # Window of the paragraph around the first matching term, with matches wrapped in `mark`
+    # The text is left as stored (e.g. "$" stays escaped for Streamlit markdown)
+    terms = sorted(query_terms(query), key=len, reverse=True)
+    if not terms:
+        return text[:width]
+
+    alternatives = "|".join(re.escape(t).replace(r"\-", "[-\u2010-\u2012]") for t in terms)
+    pattern = re.compile(r"(?<![a-z0-9])(" + alternatives + r")(?![a-z0-9])", re.IGNORECASE)
+    first = pattern.search(text)
+    start = max(0, (first.start() if first else 0) - width // 3)
+    end = min(len(text), start + width)
+
+    window = text[start:end]
+    window = pattern.sub(lambda m: f"{mark}{m.group()}{mark}", window)
+    return ("…" if start else "") + window + ("…" if end < len(text) else "")
+
+
+_indexes = content_store.PerVersionCache(SearchIndex)
+
+
+def get_index(store) -> SearchIndex:
+    return _indexes.get(store)
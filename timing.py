@@ -0,0 +1,143 @@
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import deque
+
+# -------------------------------
+# Per-rerun timing spans (opt-in)
+#
+# WAYBACK_TIMING=1 logs one JSON line per span to stderr; the ?debug query param in
+# app.py also records them per session and shows percentiles in a debug panel.
+# Disabled timers hand out one shared null span, so a span costs a method call.
+# -------------------------------
+ENV_FLAG = "WAYBACK_TIMING"
+SESSION_SAMPLES = 500  # recent samples kept per stage per session
+
+
+def _make_logger() -> logging.Logger:
+    logger = logging.getLogger("wayback.timing")
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+
+LOGGER = _make_logger()
+
+
+def logging_enabled() -> bool:
+    return os.environ.get(ENV_FLAG, "").lower() in ("1", "true", "yes")
+
+
+class SessionStats:
+    # Recent span durations per stage for one session
+    def __init__(self, maxlen: int = SESSION_SAMPLES) -> None:
+        self._lock = threading.Lock()
+        self._samples = {}
+        self._maxlen = maxlen
+
+    def add(self, stage: str, ms: float) -> None:
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = deque(maxlen=self._maxlen)
+            samples.append(ms)
+
+    def summary(self, percentiles=(50, 90, 99)) -> list:
+        # [{"stage", "n", "last_ms", "p50_ms", ...}] in first-seen stage order
+        with self._lock:
+            snapshot = {stage: list(samples) for stage, samples in self._samples.items()}
+
+        rows = []
+        for stage, samples in snapshot.items():
+            ordered = sorted(samples)
+            row = {"stage": stage, "n": len(samples), "last_ms": round(samples[-1], 2)}
+            for p in percentiles:
+                # Nearest-rank percentile
+                rank = max(1, -(-p * len(ordered) // 100))
+                row[f"p{p}_ms"] = round(ordered[rank - 1], 2)
+            rows.append(row)
+        return rows
+
+
+class _Span:
+    __slots__ = ("timer", "stage", "start")
+
+    def __init__(self, timer: "Timer", stage: str) -> None:
+        self.timer = timer
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def stop(self) -> None:
+        self.timer.record(self.stage, 1000 * (time.perf_counter() - self.start))
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def stop(self) -> None:
+        pass
+
+
+_NULL = _NullSpan()
+
+
+class Timer:
+    # One per script run (or fragment run); scope tells the two apart in the logs
+    def __init__(self, scope: str, log: bool = False, stats: SessionStats = None) -> None:
+        self.scope = scope
+        self.log = log
+        self.stats = stats
+        self.enabled = log or stats is not None
+        self.run_id = uuid.uuid4().hex[:12] if self.enabled else ""
+        self.finished = False
+        self._start = time.perf_counter()
+
+    def span(self, stage: str):
+        # with timer.span("load"): ...
+        if not self.enabled:
+            return _NULL
+        return _Span(self, stage)
+
+    def start(self, stage: str):
+        # For stages that are not one block: span = timer.start("footer"); ...; span.stop()
+        return self.span(stage).__enter__()
+
+    def record(self, stage: str, ms: float) -> None:
+        if self.stats is not None:
+            self.stats.add(stage, ms)
+        if self.log:
+            LOGGER.info(json.dumps({
+                "event": "span",
+                "ts": round(time.time(), 3),
+                "run": self.run_id,
+                "scope": self.scope,
+                "stage": stage,
+                "ms": round(ms, 3),
+            }))
+
+    def finish(self) -> None:
+        # Records "<scope>_total" for the whole run
+        self.finished = True
+        if self.enabled:
+            self.record(f"{self.scope}_total", 1000 * (time.perf_counter() - self._start))
@@ -0,0 +1,165 @@
+from collections import Counter
+
+import numpy as np
+
+import content_store
+from content_store import year_sort_key
+from search_index import STOPWORDS, query_terms, tokenize
+
+# -------------------------------
+# Term trends across niche x year
+#
+# One sparse term-document matrix per content version, where a document is every
+# year-specific paragraph of one (niche, year). It is stored column-major (CSC):
+# for term t, rows[indptr[t]:indptr[t + 1]] are the row ids and counts[...] the
+# counts, with row id = niche index * number of years + year index. A theme's
+# trend is one column slice scattered into a (niche, year) grid; top movers are
+# weighted bincounts over all non-zeros, so nothing loops over strings per request.
+# Counts are kept per niche and reused across reloads that did not touch the niche.
+# -------------------------------
+DEFAULT_THEMES = ("AI", "automation", "5G", "resilience")
+
+# The conclusion is shared by every year of a specialism, so it carries no trend
+TREND_SECTIONS = ("market_shift", "technical_shift", "talent_shift", "investment")
+
+# Rates are reported per this many tokens of a (niche, year)
+PER_TOKENS = 1000
+
+
+class _NicheCounts:
+    # Token counts per year of one niche; reused by the next matrix while the niche's
+    # content version is unchanged, so a reload only re-tokenises edited niches.
+    def __init__(self, store, niche: str) -> None:
+        self.version = store.niche_version(niche)
+        self.years = list(store.available_years_for(niche))
+        vocabulary = {}
+        year_ids, term_ids, counts, totals = [], [], [], []
+
+        for j, year in enumerate(self.years):
+            payload = store.get_year_payload(niche, year)
+            tokens = [t for key in TREND_SECTIONS for p in payload[key] for t in tokenize(p)]
+            totals.append(len(tokens))
+            for token, count in Counter(tokens).items():
+                year_ids.append(j)
+                term_ids.append(vocabulary.setdefault(token, len(vocabulary)))
+                counts.append(count)
+
+        self.terms = list(vocabulary)
+        self.year_ids = np.array(year_ids, dtype=np.int64)
+        self.term_ids = np.array(term_ids, dtype=np.int64)
+        self.counts = np.array(counts, dtype=np.float64)
+        self.totals = np.array(totals, dtype=np.float64)
+
+
+class TrendMatrix:
+    def __init__(self, store, previous: "TrendMatrix" = None) -> None:
+        self.version = store.version
+        self.niches = list(store.niches)
+        self.segments = {}
+        for niche in self.niches:
+            segment = previous.segments.get(niche) if previous else None
+            if segment is None or segment.version != store.niche_version(niche):
+                segment = _NicheCounts(store, niche)
+            self.segments[niche] = segment
+
+        years = {year for segment in self.segments.values() for year in segment.years}
+        self.years = sorted(years, key=year_sort_key)
+        year_index = {year: j for j, year in enumerate(self.years)}
+        n_years = len(self.years)
+
+        vocabulary = {}
+        cols, rows = [], []
+        totals = np.zeros((len(self.niches), n_years), dtype=np.float64)
+        for i, segment in enumerate(self.segments.values()):
+            term_map = np.array([vocabulary.setdefault(t, len(vocabulary)) for t in segment.terms], dtype=np.int64)
+            year_map = np.array([year_index[year] for year in segment.years], dtype=np.int64)
+            cols.append(term_map[segment.term_ids])
+            rows.append(i * n_years + year_map[segment.year_ids])
+            totals[i, year_map] = segment.totals
+
+        self.terms = np.array(list(vocabulary), dtype=object)
+        self._vocabulary = vocabulary
+
+        cols = np.concatenate(cols) if cols else np.zeros(0, dtype=np.int64)
+        rows = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+        counts = np.concatenate([s.counts for s in self.segments.values()]) if self.segments else np.zeros(0)
+        order = np.argsort(cols, kind="stable")
+        self.cols = cols[order]
+        self.rows = rows[order]
+        self.counts = counts[order]
+        self.indptr = np.searchsorted(self.cols, np.arange(len(vocabulary) + 1))
+        self.totals = totals
+
+        # Terms that are too generic to be a theme
+        self._ignored = np.array(
+            [t in STOPWORDS or len(t) < 2 or t.isdigit() for t in self.terms], dtype=bool
+        )
+
+    def term_id(self, term: str):
+        terms = query_terms(term)
+        return self._vocabulary.get(terms[0]) if terms else None
+
+    def counts_grid(self, term: str) -> np.ndarray:
+        # (niche, year) counts of one term: a column slice scattered into a dense grid
+        grid = np.zeros(self.totals.size, dtype=np.float64)
+        t = self.term_id(term)
+        if t is not None:
+            start, end = self.indptr[t], self.indptr[t + 1]
+            grid[self.rows[start:end]] = self.counts[start:end]
+        return grid.reshape(self.totals.shape)
+
+    def rates(self, themes, niche: str = None) -> np.ndarray:
+        # (year, theme) occurrences per PER_TOKENS tokens, for one niche or all of them
+        grids = np.stack([self.counts_grid(theme) for theme in themes], axis=-1)
+        if niche is None:
+            counts, totals = grids.sum(axis=0), self.totals.sum(axis=0)
+        else:
+            i = self.niches.index(niche)
+            counts, totals = grids[i], self.totals[i]
+        return PER_TOKENS * counts / np.maximum(totals, 1)[:, None]
+
+    def by_niche(self, theme: str) -> np.ndarray:
+        # (year, niche) rate of one theme, one column per specialism
+        return (PER_TOKENS * self.counts_grid(theme) / np.maximum(self.totals, 1)).T
+
+    def movers(self, niche: str = None, window: int = 3, limit: int = 10, min_count: int = 3):
+        # Terms whose rate changed most between the first and last `window` years.
+        # Returns (terms, early rate, late rate, change), largest rise first.
+        n_years = len(self.years)
+        window = max(1, min(window, n_years // 2))
+        niche_of, year_of = np.divmod(self.rows, n_years)
+
+        if niche is None:
+            selected = np.ones(len(self.rows), dtype=bool)
+            totals = self.totals.sum(axis=0)
+        else:
+            i = self.niches.index(niche)
+            selected = niche_of == i
+            totals = self.totals[i]
+
+        n_terms = len(self.terms)
+        early = selected & (year_of < window)
+        late = selected & (year_of >= n_years - window)
+        early_counts = np.bincount(self.cols[early], weights=self.counts[early], minlength=n_terms)
+        late_counts = np.bincount(self.cols[late], weights=self.counts[late], minlength=n_terms)
+
+        early_rate = PER_TOKENS * early_counts / max(totals[:window].sum(), 1)
+        late_rate = PER_TOKENS * late_counts / max(totals[n_years - window:].sum(), 1)
+        change = late_rate - early_rate
+
+        eligible = ~self._ignored & (early_counts + late_counts >= min_count)
+        candidates = np.flatnonzero(eligible)
+        top = candidates[np.argsort(-change[candidates], kind="stable")]
+        rising, falling = top[:limit], top[::-1][:limit]
+
+        def table(ids):
+            return self.terms[ids].tolist(), early_rate[ids], late_rate[ids], change[ids]
+
+        return table(rising), table(falling)
+
+
+_matrices = content_store.PerVersionCache(TrendMatrix)
+
+
+def get_matrix(store) -> TrendMatrix:
+    return _matrices.get(store)